@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import re
+import time
+from typing import List, Dict, Optional, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_specs.json')
+
+
+def _class_matches(regex, classes: List[str]) -> bool:
+    """
+    Match a class regex the way BeautifulSoup does for multi-valued attributes
+    """
+    if not classes:
+        return False
+    return any(regex.search(c) for c in classes) or bool(regex.search(' '.join(classes)))
+
+
+class CardExtractor:
+    """
+    Single-pass job card extractor compiled from a declarative platform spec.
+
+    Each field lists selector rules in order of preference. All rules are indexed
+    by tag name, so one walk over the card's descendants finds the first match in
+    document order for every rule, mirroring chained ``card.find(...) or ...`` calls.
+    """
+    def __init__(self, platform: str, spec: Dict[str, Any], post_processors: Dict[str, Callable] = None):
+        self.platform = platform
+        self.card_tag = spec['card']['tag']
+        self.card_class = spec['card']['class']
+        self.base_url = spec.get('base_url', '')
+        self.required = spec.get('required', [])
+
+        self.post_processors = {'join_url': self._join_url}
+        self.post_processors.update(post_processors or {})
+
+        self.fields = list(spec['fields'].keys())
+        # tag name -> [(field index, rank, class regex, descend, attr, post processor)]
+        self.rules: Dict[str, List[Tuple]] = {}
+        for field_index, field in enumerate(self.fields):
+            for rank, rule in enumerate(spec['fields'][field]):
+                post = rule.get('post')
+                if post and post not in self.post_processors:
+                    raise ValueError(f"Unknown post processor '{post}' for {platform}.{field}")
+                regex = re.compile(rule['class']) if rule.get('class') else None
+                self.rules.setdefault(rule['tag'], []).append(
+                    (field_index, rank, regex, rule.get('descend'), rule.get('attr'), post)
+                )
+
+    def _join_url(self, href: str) -> str:
+        if href.startswith('http'):
+            return href
+        return self.base_url + href
+
+    def extract(self, card) -> Optional[Dict[str, Any]]:
+        """
+        Extract all fields from a card in a single traversal
+        """
+        rules = self.rules
+        best_rank = [None] * len(self.fields)
+        best_match = [None] * len(self.fields)
+        pending = len(self.fields)
+
+        for node in card.descendants:
+            candidates = rules.get(node.name)
+            if not candidates:
+                continue
+
+            classes = None
+            for field_index, rank, regex, descend, attr, post in candidates:
+                current = best_rank[field_index]
+                if current is not None and current <= rank:
+                    continue
+                if regex is not None:
+                    if classes is None:
+                        classes = node.get('class') or []
+                    if not _class_matches(regex, classes):
+                        continue
+
+                best_rank[field_index] = rank
+                best_match[field_index] = (node, descend, attr, post)
+                if rank == 0:
+                    pending -= 1
+
+            if pending == 0:
+                break
+
+        job: Dict[str, Any] = {}
+        for field, match in zip(self.fields, best_match):
+            if match is None:
+                continue
+
+            node, descend, attr, post = match
+            if descend and node.name != descend:
+                node = node.find(descend)
+                if node is None:
+                    continue
+
+            value = node.get(attr) if attr else node.get_text(strip=True)
+            if value is None:
+                continue
+            if post:
+                value = self.post_processors[post](value)
+
+            if '.' in field:
+                parent, child = field.split('.', 1)
+                job.setdefault(parent, {})[child] = value
+            else:
+                job[field] = value
+
+        for field in self.required:
+            parent, _, child = field.partition('.')
+            value = job.get(parent)
+            if child:
+                value = value.get(child) if isinstance(value, dict) else None
+            if not value:
+                return None
+
+        return job
+
+
+class ExtractorRegistry:
+    """
+    Compiled extractors per platform, recompiled when the spec file changes on disk
+    """
+    def __init__(self,
+                 spec_path: str = DEFAULT_SPEC_PATH,
+                 post_processors: Dict[str, Callable] = None,
+                 check_interval: float = 1.0):
+        self.spec_path = spec_path
+        self.post_processors = post_processors or {}
+        self.check_interval = check_interval
+        self.extractors: Dict[str, CardExtractor] = {}
+        self._mtime = None
+        self._last_check = 0.0
+        self.reload()
+
+    def reload(self) -> bool:
+        """
+        Compile the spec file, keeping the previous extractors if it is invalid
+        """
+        try:
+            mtime = os.path.getmtime(self.spec_path)
+            with open(self.spec_path) as f:
+                specs = json.load(f)
+
+            self.extractors = {
+                platform: CardExtractor(platform, spec, self.post_processors)
+                for platform, spec in specs.items()
+            }
+            self._mtime = mtime
+            logger.info(f"Loaded extraction specs for {len(self.extractors)} platforms")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading extraction specs from {self.spec_path}: {e}")
+            return False
+
+    def get(self, platform: str) -> Optional[CardExtractor]:
+        """
+        Extractor for a platform, picking up spec changes at most once per interval
+        """
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            try:
+                if os.path.getmtime(self.spec_path) != self._mtime:
+                    self.reload()
+            except OSError:
+                pass
+
+        return self.extractors.get(platform)
@@ -0,0 +1,511 @@
+import asyncio
+import bisect
+import copy
+import glob
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+from typing import List, Dict, Optional, Any
+
+from searchRefreshScheduler import SearchRefreshScheduler
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'AJSNAP01'
+HEADER_LENGTH = struct.Struct('<I')
+ROW_GROUP_SIZE = 4096
+DATETIME_COLUMNS = {'posted_date'}
+# Fields that depend on when and for which search a job was returned, so they are kept per crawl
+CRAWL_FIELDS = ('match_score', 'scraped_at', 'metadata', 'posted_date')
+
+
+def job_version(job: Dict[str, Any]) -> str:
+    """
+    Content hash of a job's shared fields; a board editing a posting yields a new version
+    """
+    shared = {k: v for k, v in job.items() if k not in CRAWL_FIELDS}
+    data = json.dumps(shared, sort_keys=True, default=_encode_value)
+    return hashlib.md5(data.encode()).hexdigest()[:16]
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("Snapshot was written with zstd but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class CorpusSegment:
+    """
+    Read-only, memory-mapped snapshot file.
+
+    Rows are split into row groups and each column of a group is compressed
+    on its own, so a column block is only decompressed when a row in that
+    group is first read.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a corpus snapshot")
+        start = len(MAGIC)
+        (header_length,) = HEADER_LENGTH.unpack_from(self._mmap, start)
+        start += HEADER_LENGTH.size
+        self.header = json.loads(self._mmap[start:start + header_length])
+        self._data_offset = start + header_length
+
+        self.codec = self.header['codec']
+        self.columns: List[str] = self.header['columns']
+        self.rows: int = self.header['rows']
+        self.created_at: float = self.header['created_at']
+        self._blocks: Dict[tuple, List[Any]] = {}
+        self._crawls: Optional[List[Dict[str, Any]]] = None
+
+        # Row groups copied over from older snapshots can be smaller than ROW_GROUP_SIZE
+        self.group_starts: List[int] = []
+        total = 0
+        for group in self.header['row_groups']:
+            self.group_starts.append(total)
+            total += group['rows']
+
+    def raw_block(self, offset: int, length: int) -> bytes:
+        start = self._data_offset + offset
+        return self._mmap[start:start + length]
+
+    def _block(self, offset: int, length: int) -> bytes:
+        return _decompress(self.raw_block(offset, length), self.codec)
+
+    def column(self, group: int, name: str) -> List[Any]:
+        key = (group, name)
+        values = self._blocks.get(key)
+        if values is None:
+            block = self.header['row_groups'][group]['blocks'].get(name)
+            if block is None:
+                values = [None] * self.header['row_groups'][group]['rows']
+            else:
+                values = json.loads(self._block(*block))
+                if name in DATETIME_COLUMNS:
+                    values = [datetime.fromisoformat(v) if v else v for v in values]
+            self._blocks[key] = values
+        return values
+
+    def row(self, index: int) -> Dict[str, Any]:
+        group = bisect.bisect_right(self.group_starts, index) - 1
+        offset = index - self.group_starts[group]
+        return {name: self.column(group, name)[offset] for name in self.columns}
+
+    def group_rows(self, group: int) -> List[Dict[str, Any]]:
+        start = self.group_starts[group]
+        return [self.row(i) for i in range(start, start + self.header['row_groups'][group]['rows'])]
+
+    def column_values(self, name: str) -> List[Any]:
+        values = []
+        for group in range(len(self.header['row_groups'])):
+            values.extend(self.column(group, name))
+        return values
+
+    def crawls(self) -> List[Dict[str, Any]]:
+        if self._crawls is None:
+            self._crawls = json.loads(self._block(*self.header['crawls']))
+        return self._crawls
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+class JobCorpus:
+    """
+    Enhanced jobs and the crawls that produced them.
+
+    A corpus loaded from a snapshot keeps reading rows from the memory-mapped
+    segment; anything added afterwards lives in memory on top of it. Rows are
+    keyed by external ID and content version, so crawls share a row only while
+    the board returns the posting unchanged; the fields in CRAWL_FIELDS are
+    stored on each crawl. Replaying a crawl returns exactly what it returned.
+
+    Crawls beyond `max_crawls` or older than `max_age` seconds are dropped,
+    along with the jobs no remaining crawl refers to.
+    """
+    def __init__(self, segment: CorpusSegment = None, max_crawls: int = None, max_age: float = None):
+        self.segment = segment
+        self.max_crawls = max_crawls
+        self.max_age = max_age
+        self._jobs: Dict[tuple, Dict[str, Any]] = {}
+        self._segment_index: Optional[Dict[tuple, int]] = None
+        self.crawls: List[Dict[str, Any]] = list(segment.crawls()) if segment else []
+        self.dirty = False
+        self.prune()
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'JobCorpus':
+        return cls(CorpusSegment(path), **kwargs)
+
+    @classmethod
+    def load_latest(cls, directory: str, **kwargs) -> 'JobCorpus':
+        """
+        Warm start from the newest snapshot in `directory`, or start empty
+        """
+        paths = sorted(glob.glob(os.path.join(directory, 'corpus-*.snap')))
+        for path in reversed(paths):
+            try:
+                corpus = cls.load(path, **kwargs)
+                logger.info(f"Loaded corpus snapshot {path} ({corpus.segment.rows} jobs, {len(corpus.crawls)} crawls)")
+                return corpus
+            except Exception as e:
+                logger.error(f"Error loading corpus snapshot {path}: {e}")
+        return cls(**kwargs)
+
+    def _segment_keys(self) -> List[tuple]:
+        if self.segment is None:
+            return []
+        return list(zip(self.segment.column_values('external_id'), self.segment.column_values('_version')))
+
+    def _index(self) -> Dict[tuple, int]:
+        # Built on first lookup so startup only maps the file
+        if self._segment_index is None:
+            self._segment_index = {key: i for i, key in enumerate(self._segment_keys())}
+        return self._segment_index
+
+    def __len__(self) -> int:
+        return len(self.row_keys())
+
+    def row_keys(self) -> List[tuple]:
+        """
+        (external_id, version) of the rows referenced by at least one crawl
+        """
+        keys = {}
+        for crawl in self.crawls:
+            versions = crawl.get('versions', {})
+            keys.update(dict.fromkeys((external_id, versions.get(external_id)) for external_id in crawl['job_ids']))
+        return list(keys)
+
+    def get(self, external_id: str, version: str = None) -> Optional[Dict[str, Any]]:
+        key = (external_id, version)
+        job = self._jobs.get(key)
+        if job is not None:
+            return job
+        index = self._index().get(key)
+        if index is None:
+            return None
+        job = self.segment.row(index)
+        job.pop('_version', None)
+        return job
+
+    def prune(self, now: float = None):
+        """
+        Drop crawls past the retention limits and jobs no longer referenced
+        """
+        now = time.time() if now is None else now
+        crawls = self.crawls
+        if self.max_age is not None:
+            crawls = [crawl for crawl in crawls if now - crawl['timestamp'] <= self.max_age]
+        if self.max_crawls is not None:
+            crawls = crawls[-self.max_crawls:] if self.max_crawls > 0 else []
+        if len(crawls) == len(self.crawls):
+            return
+
+        self.crawls = crawls
+        live = set(self.row_keys())
+        self._jobs = {key: job for key, job in self._jobs.items() if key in live}
+        self.dirty = True
+
+    def add_crawl(self,
+                  query: str,
+                  location: str,
+                  platforms: List[str],
+                  filters: Dict[str, Any],
+                  jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Record the result of a search and the jobs it returned
+        """
+        job_ids = []
+        versions = {}
+        overrides = {}
+        for job in jobs:
+            external_id = job.get('external_id')
+            if not external_id:
+                continue
+            version = job_version(job)
+            job_ids.append(external_id)
+            versions[external_id] = version
+            self._jobs.setdefault(
+                (external_id, version),
+                copy.deepcopy({k: v for k, v in job.items() if k not in CRAWL_FIELDS})
+            )
+            overrides[external_id] = copy.deepcopy({k: job[k] for k in CRAWL_FIELDS if k in job})
+
+        now = time.time()
+        key = SearchRefreshScheduler.crawl_key(query, location, filters)
+        crawl = {
+            'crawl_id': f"{key[:12]}-{int(now * 1000)}",
+            'key': key,
+            'query': query,
+            'location': location,
+            'platforms': sorted(platforms),
+            'filters': filters,
+            'timestamp': now,
+            'job_ids': job_ids,
+            'versions': versions,
+            'overrides': overrides
+        }
+        self.crawls.append(crawl)
+        self.dirty = True
+        self.prune(now)
+        return crawl
+
+    def latest_crawl(self,
+                     query: str,
+                     location: str,
+                     platforms: List[str],
+                     filters: Dict[str, Any],
+                     max_age: float = None) -> Optional[Dict[str, Any]]:
+        """
+        Most recent crawl covering the same search, optionally no older than `max_age` seconds
+        """
+        key = SearchRefreshScheduler.crawl_key(query, location, filters)
+        for crawl in reversed(self.crawls):
+            if crawl['key'] != key or not set(platforms) <= set(crawl['platforms']):
+                continue
+            if max_age is not None and time.time() - crawl['timestamp'] > max_age:
+                return None
+            return crawl
+        return None
+
+    def crawl_jobs(self, crawl: Dict[str, Any], platforms: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Jobs of a crawl in their original order with that crawl's scores, as independent copies
+        """
+        jobs = []
+        versions = crawl.get('versions', {})
+        overrides = crawl.get('overrides', {})
+        for external_id in crawl['job_ids']:
+            job = self.get(external_id, versions.get(external_id))
+            if job is not None and (platforms is None or job.get('source_platform') in platforms):
+                job = copy.deepcopy(job)
+                for name, value in overrides.get(external_id, {}).items():
+                    # Crawls read back from a snapshot hold dates as ISO strings
+                    if name in DATETIME_COLUMNS and isinstance(value, str):
+                        value = datetime.fromisoformat(value)
+                    job[name] = copy.deepcopy(value)
+                jobs.append(job)
+        return jobs
+
+    def snapshot_plan(self) -> List[Any]:
+        """
+        Row groups for the next snapshot.
+
+        Segment row groups whose rows are all still referenced and not replaced in
+        memory are listed by index, so their compressed blocks are copied as is.
+        Every other live row is materialized into lists of at most ROW_GROUP_SIZE.
+        """
+        live = dict.fromkeys(self.row_keys())
+        plan = []
+
+        if self.segment is not None:
+            keys = self._segment_keys()
+            starts = self.segment.group_starts + [self.segment.rows]
+            for group in range(len(starts) - 1):
+                group_keys = keys[starts[group]:starts[group + 1]]
+                if all(key in live and key not in self._jobs for key in group_keys):
+                    plan.append(group)
+                    for key in group_keys:
+                        live.pop(key, None)
+
+        rows = []
+        for external_id, version in live:
+            job = self.get(external_id, version)
+            if job is not None:
+                rows.append(dict(job, _version=version))
+
+        for start in range(0, len(rows), ROW_GROUP_SIZE):
+            plan.append(rows[start:start + ROW_GROUP_SIZE])
+        return plan
+
+
+def write_snapshot(corpus: JobCorpus,
+                   directory: str,
+                   keep: int = 3,
+                   plan: List[Any] = None,
+                   crawls: List[Dict[str, Any]] = None) -> str:
+    """
+    Write the corpus as a compressed columnar snapshot and prune old ones.
+
+    `plan` comes from JobCorpus.snapshot_plan: segment row group indices are
+    copied without decompressing, lists of rows are compressed into new groups.
+    """
+    if plan is None:
+        plan = corpus.snapshot_plan()
+    if crawls is None:
+        crawls = corpus.crawls
+    codec = 'zstd' if zstandard is not None else 'zlib'
+    segment = corpus.segment
+    if segment is not None and segment.codec != codec:
+        # Blocks can only be copied between snapshots written with the same codec
+        plan = [segment.group_rows(group) if isinstance(group, int) else group for group in plan]
+
+    columns = {}
+    for group in plan:
+        if isinstance(group, int):
+            columns.update(dict.fromkeys(segment.columns))
+        else:
+            columns.update(dict.fromkeys(name for row in group for name in row))
+    columns = list(columns)
+
+    data = bytearray()
+    row_groups = []
+
+    def append_payload(payload: bytes) -> List[int]:
+        offset = len(data)
+        data.extend(payload)
+        return [offset, len(payload)]
+
+    def append_block(values) -> List[int]:
+        return append_payload(_compress(json.dumps(values, default=_encode_value).encode(), codec))
+
+    for group in plan:
+        if isinstance(group, int):
+            source = segment.header['row_groups'][group]
+            row_groups.append({
+                'rows': source['rows'],
+                'blocks': {name: append_payload(segment.raw_block(*block)) for name, block in source['blocks'].items()}
+            })
+        else:
+            row_groups.append({
+                'rows': len(group),
+                'blocks': {name: append_block([row.get(name) for row in group]) for name in columns}
+            })
+
+    rows = sum(group['rows'] for group in row_groups)
+    header = {
+        'version': 1,
+        'codec': codec,
+        'created_at': time.time(),
+        'rows': rows,
+        'columns': columns,
+        'row_groups': row_groups,
+        'crawls': append_block(crawls)
+    }
+    header_bytes = json.dumps(header).encode()
+
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+    path = os.path.join(directory, f"corpus-{stamp}.snap")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    for old in sorted(glob.glob(os.path.join(directory, 'corpus-*.snap')))[:-keep]:
+        try:
+            os.remove(old)
+        except OSError as e:
+            logger.error(f"Error removing old snapshot {old}: {e}")
+
+    copied = sum(1 for group in plan if isinstance(group, int))
+    logger.info(f"Wrote corpus snapshot {path} ({rows} jobs, {len(crawls)} crawls, {copied}/{len(plan)} row groups copied)")
+    return path
+
+
+class CorpusSnapshotter:
+    """
+    Periodically snapshots a corpus when it has changed
+    """
+    def __init__(self, corpus: JobCorpus, directory: str, interval: float = 300.0, keep: int = 3):
+        self.corpus = corpus
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self._running = False
+
+    async def snapshot(self) -> Optional[str]:
+        self.corpus.prune()
+        if not self.corpus.dirty:
+            return None
+        # Plan on the loop so compression in the worker thread sees a consistent view;
+        # untouched segment row groups are copied rather than decompressed
+        plan = self.corpus.snapshot_plan()
+        crawls = list(self.corpus.crawls)
+        self.corpus.dirty = False
+        try:
+            return await asyncio.to_thread(write_snapshot, self.corpus, self.directory, self.keep, plan, crawls)
+        except Exception as e:
+            self.corpus.dirty = True
+            logger.error(f"Error writing corpus snapshot: {e}")
+            return None
+
+    async def run(self):
+        self._running = True
+        while self._running:
+            await asyncio.sleep(self.interval)
+            await self.snapshot()
+
+    def stop(self):
+        self._running = False
+
+
+class SnapshotReplayService:
+    """
+    Drop-in stand-in for JobSearchService that answers searches from a snapshot.
+
+    Useful for benchmarking downstream code without touching the boards and for
+    reproducing exactly what a past crawl returned.
+    """
+    def __init__(self, path: str):
+        self.corpus = JobCorpus.load(path)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.corpus.segment.close()
+
+    def list_crawls(self) -> List[Dict[str, Any]]:
+        return [{k: v for k, v in crawl.items() if k not in ('job_ids', 'versions', 'overrides')} for crawl in self.corpus.crawls]
+
+    def replay(self, crawl_id: str) -> List[Dict[str, Any]]:
+        for crawl in self.corpus.crawls:
+            if crawl['crawl_id'] == crawl_id:
+                return self.corpus.crawl_jobs(crawl)
+        raise KeyError(f"No crawl {crawl_id} in snapshot")
+
+    async def search_jobs(self,
+                          query: str,
+                          location: str = '',
+                          platforms: List[str] = None,
+                          filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        if platforms is None:
+            platforms = ['indeed', 'glassdoor', 'ziprecruiter']
+        crawl = self.corpus.latest_crawl(query, location, [], filters or {})
+        if crawl is None:
+            return []
+        return self.corpus.crawl_jobs(crawl, platforms)
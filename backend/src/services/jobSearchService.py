@@ -1,7 +1,7 @@
 import asyncio
 import aiohttp
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
 import re
@@ -11,11 +11,44 @@ from urllib.parse import urlencode, quote
 import time
 import random
 
+from streamingCardParser import stream_cards
+from cardExtractor import ExtractorRegistry
+from locationGazetteer import LocationGazetteer, parse_radius
+from paginatedSearch import SearchPaginator
+
 logger = logging.getLogger(__name__)
 
+# Job cards read from each board result page
+CARDS_PER_PAGE = 20
+
 class JobSearchService:
-    def __init__(self):
+    def __init__(self,
+                 streaming: bool = False,
+                 base_urls: Dict[str, str] = None,
+                 request_delay: Tuple[float, float] = (0.5, 2.0),
+                 connection_limit: int = 10,
+                 connection_limit_per_host: int = 5,
+                 corpus=None,
+                 corpus_max_age: float = None):
         self.session = None
+        # Parse result pages incrementally as bytes arrive instead of buffering them
+        self.streaming = streaming
+        # Board hosts to fetch result pages from; overridable to target a mock server
+        self.base_urls = {
+            'indeed': 'https://www.indeed.com',
+            'glassdoor': 'https://www.glassdoor.com',
+            'ziprecruiter': 'https://www.ziprecruiter.com',
+            'monster': 'https://www.monster.com',
+            'careerbuilder': 'https://www.careerbuilder.com'
+        }
+        self.base_urls.update(base_urls or {})
+        self.request_delay = request_delay
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        # Optional JobCorpus recording every search; with corpus_max_age set,
+        # searches crawled more recently than that are answered from it
+        self.corpus = corpus
+        self.corpus_max_age = corpus_max_age
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -25,16 +58,21 @@ class JobSearchService:
             'Upgrade-Insecure-Requests': '1'
         }
         self.scrapers = {
-            'linkedin': self._scrape_linkedin,
             'indeed': self._scrape_indeed,
             'glassdoor': self._scrape_glassdoor,
             'ziprecruiter': self._scrape_ziprecruiter,
             'monster': self._scrape_monster,
             'careerbuilder': self._scrape_careerbuilder
         }
+        # Declarative card extractors, reloaded when extraction_specs.json changes
+        self.extractors = ExtractorRegistry(post_processors={'date': self._parse_date})
+        # Offline place index for location IDs, proximity scoring and radius filtering
+        self.gazetteer = LocationGazetteer()
+        # Per-search buffers of fetched board pages for cursor pagination
+        self.paginator = SearchPaginator(self)
         
     async def __aenter__(self):
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
+        connector = aiohttp.TCPConnector(limit=self.connection_limit, limit_per_host=self.connection_limit_per_host)
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             headers=self.headers,
@@ -61,6 +99,11 @@ class JobSearchService:
         if filters is None:
             filters = {}
             
+        if self.corpus is not None and self.corpus_max_age is not None:
+            crawl = self.corpus.latest_crawl(query, location, platforms, filters, self.corpus_max_age)
+            if crawl is not None:
+                return self.corpus.crawl_jobs(crawl, platforms)
+            
         all_jobs = []
         tasks = []
         
@@ -84,18 +127,44 @@ class JobSearchService:
         unique_jobs = self._remove_duplicates(all_jobs)
         enhanced_jobs = self._enhance_job_data(unique_jobs, query, filters)
         
+        enhanced_jobs = self._filter_by_radius(enhanced_jobs, location, filters)
+        
+        if self.corpus is not None:
+            self.corpus.add_crawl(query, location, platforms, filters, enhanced_jobs)
+        
         return enhanced_jobs
     
-    async def _safe_scrape(self, platform: str, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def search_jobs_page(self,
+                               query: str,
+                               location: str = '',
+                               platforms: List[str] = None,
+                               filters: Dict[str, Any] = None,
+                               cursor: str = None,
+                               page_size: int = 20) -> Dict[str, Any]:
+        """
+        Search for jobs one page at a time, fetching further board pages lazily.
+        Pass the returned next_cursor to get the following page.
+        """
+        if platforms is None:
+            platforms = ['indeed', 'glassdoor', 'ziprecruiter']
+            
+        if filters is None:
+            filters = {}
+            
+        platforms = [platform for platform in platforms if platform in self.scrapers]
+        return await self.paginator.page(query, location, platforms, filters, cursor, page_size)
+    
+    async def _safe_scrape(self, platform: str, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Safely execute scraping with error handling and rate limiting
         """
         try:
             # Add random delay to avoid rate limiting
-            await asyncio.sleep(random.uniform(0.5, 2.0))
+            if self.request_delay[1] > 0:
+                await asyncio.sleep(random.uniform(*self.request_delay))
             
             scraper = self.scrapers[platform]
-            jobs = await scraper(query, location, filters)
+            jobs = await scraper(query, location, filters, page)
             
             # Add source platform to each job
             for job in jobs:
@@ -109,7 +178,7 @@ class JobSearchService:
             logger.error(f"Error scraping {platform}: {e}")
             return []
     
-    async def _scrape_indeed(self, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _scrape_indeed(self, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Scrape jobs from Indeed
         """
@@ -120,7 +189,7 @@ class JobSearchService:
                 'q': query,
                 'l': location,
                 'sort': 'date',
-                'limit': 50
+                'limit': CARDS_PER_PAGE
             }
             
             # Add filters
@@ -131,18 +200,15 @@ class JobSearchService:
             if filters.get('job_type'):
                 params['jt'] = filters['job_type']
                 
-            url = f"https://www.indeed.com/jobs?{urlencode(params)}"
+            if page:
+                params['start'] = page * CARDS_PER_PAGE
+                
+            url = f"{self.base_urls['indeed']}/jobs?{urlencode(params)}"
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Parse job listings
-                    job_cards = soup.find_all('div', {'class': re.compile(r'job_seen_beacon|jobsearch-SerpJobCard')})
-                    
-                    for card in job_cards[:20]:  # Limit to 20 jobs per platform
-                        job = self._parse_indeed_job(card)
+                    async for card in self._iter_cards(response, 'indeed', 'div', r'job_seen_beacon|jobsearch-SerpJobCard'):
+                        job = self._parse_card('indeed', card, self._parse_indeed_job)
                         if job:
                             jobs.append(job)
                             
@@ -151,6 +217,42 @@ class JobSearchService:
             
         return jobs
     
+    async def _iter_cards(self, response, platform: str, tag: str, class_pattern: str, limit: int = CARDS_PER_PAGE):
+        """
+        Yield up to `limit` job cards from a result page, streaming when enabled
+        """
+        extractor = self.extractors.get(platform)
+        if extractor:
+            tag, class_pattern = extractor.card_tag, extractor.card_class
+            
+        if self.streaming:
+            async for markup in stream_cards(response, tag, class_pattern, limit):
+                yield BeautifulSoup(markup, 'html.parser').find(tag)
+        else:
+            html = await response.text()
+            soup = BeautifulSoup(html, 'html.parser')
+            for card in soup.find_all(tag, {'class': re.compile(class_pattern)})[:limit]:
+                yield card
+    
+    def _parse_card(self, platform: str, card, fallback) -> Optional[Dict[str, Any]]:
+        """
+        Parse a job card with the platform's compiled extractor, falling back to
+        the hand-written parser when no spec is loaded for the platform
+        """
+        extractor = self.extractors.get(platform)
+        if extractor is None:
+            return fallback(card)
+            
+        try:
+            job = extractor.extract(card)
+            if job:
+                job['external_id'] = self._generate_job_id(job.get('title', ''), job.get('company', {}).get('name', ''), platform)
+            return job
+            
+        except Exception as e:
+            logger.error(f"Error extracting {platform} job: {e}")
+            return None
+    
     def _parse_indeed_job(self, card) -> Optional[Dict[str, Any]]:
         """
         Parse individual Indeed job card
@@ -202,7 +304,7 @@ class JobSearchService:
             logger.error(f"Error parsing Indeed job: {e}")
             return None
     
-    async def _scrape_glassdoor(self, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _scrape_glassdoor(self, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Scrape jobs from Glassdoor
         """
@@ -221,20 +323,17 @@ class JobSearchService:
                 'includeNoSalaryJobs': 'true'
             }
             
+            if page:
+                params['p'] = page + 1
+                
             # Build search URL
-            base_url = "https://www.glassdoor.com/Job/jobs.htm"
+            base_url = f"{self.base_urls['glassdoor']}/Job/jobs.htm"
             url = f"{base_url}?{urlencode({k: v for k, v in params.items() if v})}"
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Parse job listings
-                    job_cards = soup.find_all('li', {'class': re.compile(r'JobsList_jobListItem|react-job-listing')})
-                    
-                    for card in job_cards[:20]:
-                        job = self._parse_glassdoor_job(card)
+                    async for card in self._iter_cards(response, 'glassdoor', 'li', r'JobsList_jobListItem|react-job-listing'):
+                        job = self._parse_card('glassdoor', card, self._parse_glassdoor_job)
                         if job:
                             jobs.append(job)
                             
@@ -293,7 +392,7 @@ class JobSearchService:
             logger.error(f"Error parsing Glassdoor job: {e}")
             return None
     
-    async def _scrape_ziprecruiter(self, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _scrape_ziprecruiter(self, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Scrape jobs from ZipRecruiter
         """
@@ -309,17 +408,15 @@ class JobSearchService:
             if filters.get('remote'):
                 params['refine_by_location_type'] = 'remote'
                 
-            url = f"https://www.ziprecruiter.com/jobs-search?{urlencode(params)}"
+            if page:
+                params['page'] = page + 1
+                
+            url = f"{self.base_urls['ziprecruiter']}/jobs-search?{urlencode(params)}"
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    job_cards = soup.find_all('div', {'class': re.compile(r'job_content|JobCard')})
-                    
-                    for card in job_cards[:20]:
-                        job = self._parse_ziprecruiter_job(card)
+                    async for card in self._iter_cards(response, 'ziprecruiter', 'div', r'job_content|JobCard'):
+                        job = self._parse_card('ziprecruiter', card, self._parse_ziprecruiter_job)
                         if job:
                             jobs.append(job)
                             
@@ -369,7 +466,7 @@ class JobSearchService:
             logger.error(f"Error parsing ZipRecruiter job: {e}")
             return None
     
-    async def _scrape_monster(self, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _scrape_monster(self, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Scrape jobs from Monster
         """
@@ -381,17 +478,15 @@ class JobSearchService:
                 'tm': filters.get('date_posted', 7)
             }
             
-            url = f"https://www.monster.com/jobs/search?{urlencode(params)}"
+            if page:
+                params['page'] = page + 1
+                
+            url = f"{self.base_urls['monster']}/jobs/search?{urlencode(params)}"
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    job_cards = soup.find_all('div', {'class': re.compile(r'JobCard|job-card')})
-                    
-                    for card in job_cards[:20]:
-                        job = self._parse_monster_job(card)
+                    async for card in self._iter_cards(response, 'monster', 'div', r'JobCard|job-card'):
+                        job = self._parse_card('monster', card, self._parse_monster_job)
                         if job:
                             jobs.append(job)
                             
@@ -434,7 +529,7 @@ class JobSearchService:
             logger.error(f"Error parsing Monster job: {e}")
             return None
     
-    async def _scrape_careerbuilder(self, query: str, location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _scrape_careerbuilder(self, query: str, location: str, filters: Dict[str, Any], page: int = 0) -> List[Dict[str, Any]]:
         """
         Scrape jobs from CareerBuilder
         """
@@ -446,17 +541,15 @@ class JobSearchService:
                 'posted': filters.get('date_posted', 7)
             }
             
-            url = f"https://www.careerbuilder.com/jobs?{urlencode(params)}"
+            if page:
+                params['page_number'] = page + 1
+                
+            url = f"{self.base_urls['careerbuilder']}/jobs?{urlencode(params)}"
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    job_cards = soup.find_all('div', {'class': re.compile(r'data-results-content|job-listing')})
-                    
-                    for card in job_cards[:20]:
-                        job = self._parse_careerbuilder_job(card)
+                    async for card in self._iter_cards(response, 'careerbuilder', 'div', r'data-results-content|job-listing'):
+                        job = self._parse_card('careerbuilder', card, self._parse_careerbuilder_job)
                         if job:
                             jobs.append(job)
                             
@@ -514,6 +607,15 @@ class JobSearchService:
                 
         return unique_jobs
     
+    def _filter_by_radius(self, jobs: List[Dict[str, Any]], location: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Boards treat radius as a hint at best, so enforce it locally when it parses
+        """
+        radius = parse_radius(filters.get('radius'))
+        if not location or radius is None:
+            return jobs
+        return self.gazetteer.filter_by_radius(jobs, location, radius)
+    
     def _enhance_job_data(self, jobs: List[Dict[str, Any]], query: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Enhance job data with additional fields and standardization
@@ -565,17 +667,12 @@ class JobSearchService:
     
     def _get_location_id(self, location: str) -> str:
         """
-        Get location ID for APIs (simplified)
+        Get Glassdoor location ID from the gazetteer
         """
-        # This would normally involve geocoding API calls
-        location_map = {
-            'new york': '1132348',
-            'san francisco': '1147401',
-            'chicago': '1128808',
-            'austin': '1139761',
-            'seattle': '1150505'
-        }
-        return location_map.get(location.lower(), '1')
+        place = self.gazetteer.resolve(location)
+        if place and place.glassdoor_id:
+            return place.glassdoor_id
+        return '1'
     
     def _parse_date(self, date_str: str) -> datetime:
         """
@@ -725,8 +822,13 @@ class JobSearchService:
             
         # Location match
         location_filter = filters.get('location', '')
-        if location_filter and location_filter.lower() in job.get('location', '').lower():
-            score += 20
+        if location_filter:
+            if location_filter.lower() in job.get('location', '').lower():
+                score += 20
+            else:
+                distance = self.gazetteer.distance_miles(location_filter, job.get('location', ''))
+                if distance is not None and distance <= (parse_radius(filters.get('radius')) or 25):
+                    score += 20
             
         # Remote preference
         if filters.get('remote') and job.get('remote'):
@@ -0,0 +1,272 @@
+import json
+import logging
+import math
+import os
+import re
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer.json')
+
+EARTH_RADIUS_MILES = 3958.8
+
+REMOTE_KEYWORDS = ['remote', 'anywhere', 'work from home', 'telecommute', 'virtual']
+# Words job boards wrap around place names, e.g. "Greater Seattle Area"
+NOISE_WORDS = {'greater', 'area', 'metro', 'metropolitan', 'region', 'hybrid', 'onsite', 'in'}
+
+_TERMINAL = '\0'
+
+
+class Place(NamedTuple):
+    id: str
+    name: str
+    region: str
+    country: str
+    lat: float
+    lon: float
+    population: int
+    glassdoor_id: Optional[str]
+
+
+def normalize_location(text: str) -> str:
+    """
+    Lowercase, drop punctuation, zip codes and parenthesized notes, collapse whitespace
+    """
+    text = re.sub(r'\(.*?\)', ' ', text.lower())
+    text = re.sub(r'\b\d{5}(?:-\d{4})?\b', ' ', text)
+    text = text.replace('.', '')
+    text = re.sub(r'[^\w\s,]', ' ', text)
+    parts = [' '.join(part.split()) for part in text.split(',')]
+    return ', '.join(part for part in parts if part)
+
+
+def parse_radius(value) -> Optional[float]:
+    """
+    Radius in miles from a filter value such as 25, "25" or "25 miles"; None if unusable
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        radius = float(value)
+    else:
+        match = re.match(r'\s*(\d+(?:\.\d+)?)', str(value or ''))
+        if not match:
+            return None
+        radius = float(match.group(1))
+    return radius if 0 < radius < math.inf else None
+
+
+def haversine_miles(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances in miles from one point to arrays of points
+    """
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2.0) ** 2 + \
+        math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class LocationGazetteer:
+    """
+    Offline index mapping free-text locations to canonical places.
+
+    Names and aliases live in a character trie that serves exact, prefix and
+    bounded edit-distance lookups. Resolutions are memoized, so the repeated
+    location strings that make up most job listings cost a dict lookup.
+    """
+    def __init__(self, path: str = DEFAULT_GAZETTEER_PATH, cache_size: int = 16384):
+        self.places: List[Place] = []
+        self.trie: Dict[str, Any] = {}
+        self.qualifiers: Dict[str, set] = {}
+
+        with open(path) as f:
+            data = json.load(f)
+
+        for country, names in data.get('countries', {}).items():
+            for name in names + [country]:
+                self.qualifiers.setdefault(normalize_location(name), set()).add(country)
+        for country, regions in data.get('regions', {}).items():
+            for code, name in regions.items():
+                for key in (code, name):
+                    self.qualifiers.setdefault(normalize_location(key), set()).add(f"{country}-{code}")
+
+        for entry in data['places']:
+            place = Place(
+                entry['id'], entry['name'], entry.get('region', ''), entry['country'],
+                entry['lat'], entry['lon'], entry.get('population', 0), entry.get('glassdoor_id')
+            )
+            index = len(self.places)
+            self.places.append(place)
+            for name in [place.name] + entry.get('aliases', []):
+                self._insert(normalize_location(name), index)
+
+        self.by_id = {place.id: place for place in self.places}
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _insert(self, key: str, index: int):
+        node = self.trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(_TERMINAL, []).append(index)
+
+    def _node(self, key: str) -> Optional[Dict[str, Any]]:
+        node = self.trie
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _exact(self, key: str) -> List[int]:
+        node = self._node(key)
+        return node.get(_TERMINAL, []) if node else []
+
+    def _prefix(self, key: str) -> List[int]:
+        node = self._node(key)
+        found = []
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            for char, child in current.items():
+                if char == _TERMINAL:
+                    found.extend(child)
+                else:
+                    stack.append(child)
+        return found
+
+    def _fuzzy(self, key: str, max_edits: int) -> List[int]:
+        """
+        Places at the smallest Levenshtein distance, if within `max_edits`
+        """
+        matches = []
+        first_row = list(range(len(key) + 1))
+
+        def walk(node, char, previous_row):
+            row = [previous_row[0] + 1]
+            for i in range(1, len(key) + 1):
+                row.append(min(
+                    row[i - 1] + 1,
+                    previous_row[i] + 1,
+                    previous_row[i - 1] + (key[i - 1] != char)
+                ))
+            if _TERMINAL in node and row[-1] <= max_edits:
+                matches.extend((row[-1], index) for index in node[_TERMINAL])
+            if min(row) <= max_edits:
+                for next_char, child in node.items():
+                    if next_char != _TERMINAL:
+                        walk(child, next_char, row)
+
+        for char, child in self.trie.items():
+            if char != _TERMINAL:
+                walk(child, char, first_row)
+
+        if not matches:
+            return []
+        best = min(distance for distance, _ in matches)
+        return [index for distance, index in matches if distance == best]
+
+    def _pick(self, indices: List[int], qualifiers: List[str]) -> Optional[Place]:
+        """
+        Choose among same-named places using state/country hints, then population.
+
+        A recognised hint that rules out every candidate means the text names some
+        other place, so nothing is returned rather than a same-named place elsewhere.
+        """
+        if not indices:
+            return None
+        candidates = [self.places[i] for i in set(indices)]
+
+        hints = set()
+        for qualifier in qualifiers:
+            hints |= self.qualifiers.get(qualifier, set())
+        if hints:
+            candidates = [p for p in candidates if p.country in hints or f"{p.country}-{p.region}" in hints]
+            if not candidates:
+                return None
+
+        return max(candidates, key=lambda p: p.population)
+
+    def _resolve(self, text: str) -> Optional[Place]:
+        """
+        Resolve free text such as "Seattle, WA 98101" or "sf bay area" to a place
+        """
+        if not text or any(keyword in text.lower() for keyword in REMOTE_KEYWORDS):
+            return None
+
+        normalized = normalize_location(text)
+        if not normalized:
+            return None
+
+        parts = normalized.split(', ')
+        qualifiers = parts[1:]
+        city = parts[0]
+        stripped = ' '.join(word for word in city.split() if word not in NOISE_WORDS)
+
+        for key in dict.fromkeys([normalized.replace(',', ''), city, stripped]):
+            place = self._pick(self._exact(key), qualifiers)
+            if place:
+                return place
+
+        if not stripped:
+            return None
+
+        if len(stripped) >= 4:
+            place = self._pick(self._prefix(stripped), qualifiers)
+            if place:
+                return place
+
+        # Two edits turn many real names into others ("columbia" -> "columbus")
+        max_edits = 1 if len(stripped) < 9 else 2
+        return self._pick(self._fuzzy(stripped, max_edits), qualifiers)
+
+    def location_id(self, text: str) -> Optional[str]:
+        place = self.resolve(text)
+        return place.id if place else None
+
+    def distance_miles(self, a: str, b: str) -> Optional[float]:
+        """
+        Distance between two free-text locations, None if either is unresolvable
+        """
+        first, second = self.resolve(a), self.resolve(b)
+        if first is None or second is None:
+            return None
+        return float(haversine_miles(first.lat, first.lon, np.array([second.lat]), np.array([second.lon]))[0])
+
+    def distances_miles(self, center: str, locations: List[str]) -> np.ndarray:
+        """
+        Batched distances from `center` to every location; NaN where unresolvable
+        """
+        origin = self.resolve(center)
+        if origin is None:
+            return np.full(len(locations), np.nan)
+
+        coords = np.full((len(locations), 2), np.nan)
+        for i, location in enumerate(locations):
+            place = self.resolve(location)
+            if place is not None:
+                coords[i] = (place.lat, place.lon)
+
+        return haversine_miles(origin.lat, origin.lon, coords[:, 0], coords[:, 1])
+
+    def filter_by_radius(self,
+                         jobs: List[Dict[str, Any]],
+                         center: str,
+                         radius_miles: float,
+                         keep_unresolved: bool = True) -> List[Dict[str, Any]]:
+        """
+        Keep jobs within `radius_miles` of `center`, plus remote jobs and, optionally,
+        jobs whose location cannot be resolved
+        """
+        if not jobs or self.resolve(center) is None:
+            return jobs
+
+        distances = self.distances_miles(center, [job.get('location', '') for job in jobs])
+        with np.errstate(invalid='ignore'):
+            keep = distances <= radius_miles
+        if keep_unresolved:
+            keep |= np.isnan(distances)
+
+        return [job for job, kept in zip(jobs, keep) if kept or job.get('remote')]
@@ -0,0 +1,246 @@
+import asyncio
+import base64
+import bisect
+import hashlib
+import hmac
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def sort_key(job: Dict[str, Any]) -> Tuple[float, float, str]:
+    """
+    Stable merged ordering: match score and posted date descending, then external ID
+    """
+    posted = job.get('posted_date')
+    posted_ts = posted.timestamp() if isinstance(posted, datetime) else 0.0
+    return (-float(job.get('match_score', 0)), -posted_ts, job.get('external_id') or '')
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode((text + '=' * (-len(text) % 4)).encode())
+
+
+def encode_cursor(state: Dict[str, Any], secret: bytes) -> str:
+    data = json.dumps(state, separators=(',', ':')).encode()
+    signature = hmac.new(secret, data, hashlib.sha256).digest()[:16]
+    return f"{_b64encode(data)}.{_b64encode(signature)}"
+
+
+def decode_cursor(cursor: str, secret: bytes) -> Dict[str, Any]:
+    try:
+        payload, signature = cursor.split('.')
+        data = _b64decode(payload)
+        expected = hmac.new(secret, data, hashlib.sha256).digest()[:16]
+        valid = hmac.compare_digest(expected, _b64decode(signature))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not valid:
+        raise ValueError("Invalid cursor: signature mismatch")
+    return json.loads(data)
+
+
+class SearchSession:
+    """
+    Board pages fetched so far for one paginated search, merged in sort order.
+
+    Jobs are keyed by the board page they came from, then sort_key, so jobs
+    fetched later always queue after those already served. Delivered jobs are
+    kept, which makes every cursor of the session replayable; memory is bounded
+    by max_board_pages per platform.
+
+    Posted dates of relative ("3 days ago") or missing dates depend on when a
+    page was fetched, so a rebuilt session has slightly different keys. Cursors
+    therefore also name the last job served, and its current key is used.
+    """
+    def __init__(self, session_id: str, platforms: List[str]):
+        self.session_id = session_id
+        self.next_pages = {platform: 0 for platform in platforms}
+        self.exhausted = set()
+        self.keys: List[Tuple] = []
+        self.jobs: List[Dict[str, Any]] = []
+        self.fingerprints = set()
+        self.positions: Dict[str, Tuple] = {}
+        self.lock = asyncio.Lock()
+
+    def add(self, jobs: List[Dict[str, Any]], tier: int):
+        for job in jobs:
+            fingerprint = f"{job.get('title', '').lower().strip()}|{job.get('company', {}).get('name', '').lower().strip()}"
+            if fingerprint in self.fingerprints:
+                continue
+            self.fingerprints.add(fingerprint)
+            key = (tier,) + sort_key(job)
+            index = bisect.bisect_right(self.keys, key)
+            self.keys.insert(index, key)
+            self.jobs.insert(index, job)
+            if job.get('external_id'):
+                self.positions[job['external_id']] = key
+
+    def position(self, external_id: Optional[str], after: Optional[Tuple]) -> Optional[Tuple]:
+        """
+        Current key of the job a cursor ended on, falling back to the key it recorded
+        """
+        return self.positions.get(external_id, after) if external_id else after
+
+    def available_after(self, after: Optional[Tuple]) -> int:
+        if after is None:
+            return len(self.keys)
+        return len(self.keys) - bisect.bisect_right(self.keys, after)
+
+    def take(self, after: Optional[Tuple], count: int) -> Tuple[List[Dict[str, Any]], Optional[Tuple]]:
+        """
+        Next `count` jobs after the keyset position and the key of the last one
+        """
+        start = 0 if after is None else bisect.bisect_right(self.keys, after)
+        end = start + count
+        last = self.keys[min(end, len(self.keys)) - 1] if start < len(self.keys) else None
+        return self.jobs[start:end], last
+
+
+class SearchPaginator:
+    """
+    Cursor-based pagination over search_jobs results.
+
+    Further board pages are only fetched when the jobs buffered for a search
+    cannot fill the requested page, so page N costs the board pages it needs
+    rather than a full recomputation. Cursors carry the last returned key
+    (keyset pagination) plus each board's next page, so ordering never shifts:
+    jobs from later board pages are ordered after everything already served.
+
+    Cursors are signed with `cursor_secret`; pass the same secret to every
+    worker so cursors survive restarts and load balancing.
+    """
+    def __init__(self, service, max_sessions: int = 256, max_board_pages: int = 10, cursor_secret: bytes = None):
+        self.service = service
+        self.max_sessions = max_sessions
+        self.max_board_pages = max_board_pages
+        self.cursor_secret = cursor_secret or os.urandom(32)
+        self.sessions: 'OrderedDict[str, SearchSession]' = OrderedDict()
+
+    @staticmethod
+    def search_key(query: str, location: str, platforms: List[str], filters: Dict[str, Any]) -> str:
+        normalized = {
+            'query': ' '.join(query.lower().split()),
+            'location': ' '.join(location.lower().split()),
+            'platforms': sorted(platforms),
+            'filters': filters
+        }
+        return hashlib.md5(json.dumps(normalized, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _session(self, session_id: str, platforms: List[str]) -> Tuple[SearchSession, bool]:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session, False
+
+        session = SearchSession(session_id, platforms)
+        self.sessions[session_id] = session
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+        return session, True
+
+    async def _fetch_round(self, session: SearchSession, query: str, location: str, filters: Dict[str, Any]):
+        """
+        Fetch the next board page from every platform that still has results
+        """
+        platforms = [
+            platform for platform, page in session.next_pages.items()
+            if platform not in session.exhausted and page < self.max_board_pages
+        ]
+        pages = [session.next_pages[platform] for platform in platforms]
+        await self._fetch(session, query, location, filters, list(zip(platforms, pages)))
+
+    async def _fetch(self, session: SearchSession, query: str, location: str, filters: Dict[str, Any], requests: List[Tuple[str, int]]):
+        results = await asyncio.gather(
+            *(self.service._safe_scrape(platform, query, location, filters, page) for platform, page in requests),
+            return_exceptions=True
+        )
+
+        by_page: Dict[int, List[Dict[str, Any]]] = {}
+        for (platform, page), result in zip(requests, results):
+            session.next_pages[platform] = max(session.next_pages[platform], page + 1)
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {platform} page {page}: {result}")
+                session.exhausted.add(platform)
+            elif not result:
+                session.exhausted.add(platform)
+            else:
+                by_page.setdefault(page, []).extend(result)
+
+        # One tier per board page, so a rebuild reproduces the original order
+        for page in sorted(by_page):
+            jobs = self.service._enhance_job_data(self.service._remove_duplicates(by_page[page]), query, filters)
+            jobs = self.service._filter_by_radius(jobs, location, filters)
+            session.add(jobs, page)
+
+    async def _rebuild(self, session: SearchSession, query: str, location: str, filters: Dict[str, Any], next_pages: Dict[str, int]):
+        """
+        Recreate an evicted session by refetching the board pages the cursor already covered
+        """
+        requests = [
+            (platform, page)
+            for platform in session.next_pages
+            for page in range(min(int(next_pages.get(platform, 0)), self.max_board_pages))
+        ]
+        if requests:
+            await self._fetch(session, query, location, filters, requests)
+
+    async def page(self,
+                   query: str,
+                   location: str,
+                   platforms: List[str],
+                   filters: Dict[str, Any],
+                   cursor: str = None,
+                   page_size: int = 20) -> Dict[str, Any]:
+        key = self.search_key(query, location, platforms, filters)
+        after = None
+
+        if cursor:
+            state = decode_cursor(cursor, self.cursor_secret)
+            if state.get('k') != key:
+                raise ValueError("Cursor does not belong to this search")
+            session_id = state['s']
+            after = tuple(state['a']) if state.get('a') else None
+        else:
+            session_id = uuid.uuid4().hex
+
+        session, created = self._session(session_id, platforms)
+        async with session.lock:
+            if created and cursor:
+                await self._rebuild(session, query, location, filters, state.get('p', {}))
+                session.exhausted.update(state.get('x', []))
+            if cursor:
+                after = session.position(state.get('i'), after)
+
+            while session.available_after(after) < page_size and \
+                    any(p not in session.exhausted and n < self.max_board_pages for p, n in session.next_pages.items()):
+                await self._fetch_round(session, query, location, filters)
+
+            jobs, last = session.take(after, page_size)
+            has_more = bool(jobs) and (
+                session.available_after(last) > 0 or
+                any(p not in session.exhausted and n < self.max_board_pages for p, n in session.next_pages.items())
+            )
+
+            next_cursor = None
+            if has_more:
+                next_cursor = encode_cursor({
+                    'k': key,
+                    's': session_id,
+                    'a': list(last),
+                    'i': jobs[-1].get('external_id'),
+                    'p': session.next_pages,
+                    'x': sorted(session.exhausted)
+                }, self.cursor_secret)
+
+        return {'jobs': jobs, 'next_cursor': next_cursor}
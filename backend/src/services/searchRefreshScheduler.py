@@ -0,0 +1,307 @@
+import asyncio
+import heapq
+import logging
+import math
+import time
+import hashlib
+import json
+from typing import List, Dict, Optional, Any, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLATFORMS = ['indeed', 'glassdoor', 'ziprecruiter']
+
+
+class SavedCrawl:
+    """
+    A single crawl shared by every user whose saved search normalizes to the same key
+    """
+    def __init__(self, key: str, query: str, location: str, filters: Dict[str, Any]):
+        self.key = key
+        self.query = query
+        self.location = location
+        self.filters = filters
+        self.platforms: Set[str] = set()
+        self.subscribers: Set[str] = set()
+        # Platforms each subscriber asked for; the crawl covers their union
+        self.subscriber_platforms: Dict[str, Set[str]] = {}
+        self.last_refreshed: Optional[float] = None
+        self.results: List[Dict[str, Any]] = []
+        self.seen_ids: Dict[str, Set[str]] = {}
+        # When each platform last returned postings, for its posting rate
+        self.seen_at: Dict[str, float] = {}
+
+    @property
+    def cost(self) -> int:
+        # One board request per platform
+        return len(self.platforms)
+
+
+class SearchRefreshScheduler:
+    """
+    Refreshes users' saved searches in priority order under a global request budget.
+
+    Overlapping saved searches (same query, location and filters) are merged into a
+    single crawl; priority grows with the crawl's age, the recent activity of its
+    subscribers and the observed posting rate of the platforms it covers.
+    """
+    def __init__(self,
+                 service,
+                 request_budget: int = 60,
+                 budget_window: float = 60.0,
+                 min_refresh_interval: float = 300.0,
+                 activity_half_life: float = 3600.0,
+                 rate_smoothing: float = 0.3):
+        self.service = service
+        self.request_budget = request_budget
+        self.budget_window = budget_window
+        self.min_refresh_interval = min_refresh_interval
+        self.activity_half_life = activity_half_life
+        self.rate_smoothing = rate_smoothing
+
+        self.crawls: Dict[str, SavedCrawl] = {}
+        self.user_searches: Dict[str, Set[str]] = {}
+        self.user_activity: Dict[str, float] = {}
+        # New postings per hour, smoothed per platform
+        self.posting_rates: Dict[str, float] = {}
+
+        self._tokens = float(request_budget)
+        self._last_refill = time.monotonic()
+        self._running = False
+
+    @staticmethod
+    def crawl_key(query: str, location: str, filters: Dict[str, Any] = None) -> str:
+        """
+        Normalize a saved search into the key used to merge overlapping searches
+        """
+        normalized = {
+            'query': ' '.join(query.lower().split()),
+            'location': ' '.join(location.lower().split()),
+            'filters': {k: v for k, v in (filters or {}).items() if v not in (None, '', [])}
+        }
+        data = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.md5(data.encode()).hexdigest()
+
+    def add_saved_search(self,
+                         user_id: str,
+                         query: str,
+                         location: str = '',
+                         platforms: List[str] = None,
+                         filters: Dict[str, Any] = None) -> str:
+        """
+        Register a user's saved search, merging it into an existing crawl when possible
+        """
+        if platforms is None:
+            platforms = DEFAULT_PLATFORMS
+        if filters is None:
+            filters = {}
+
+        key = self.crawl_key(query, location, filters)
+        crawl = self.crawls.get(key)
+        if crawl is None:
+            crawl = SavedCrawl(key, query, location, filters)
+            self.crawls[key] = crawl
+
+        crawl.platforms.update(platforms)
+        crawl.subscribers.add(user_id)
+        crawl.subscriber_platforms.setdefault(user_id, set()).update(platforms)
+        self.user_searches.setdefault(user_id, set()).add(key)
+        self.user_activity.setdefault(user_id, time.time())
+        return key
+
+    def remove_saved_search(self, user_id: str, key: str):
+        """
+        Unsubscribe a user from a crawl, dropping the crawl once nobody follows it
+        """
+        crawl = self.crawls.get(key)
+        if crawl is None:
+            return
+
+        crawl.subscribers.discard(user_id)
+        crawl.subscriber_platforms.pop(user_id, None)
+        self.user_searches.get(user_id, set()).discard(key)
+        if not crawl.subscribers:
+            del self.crawls[key]
+            return
+
+        # Stop paying for boards only the departed user wanted
+        crawl.platforms = set().union(*crawl.subscriber_platforms.values())
+        crawl.results = [job for job in crawl.results if job.get('source_platform') in crawl.platforms]
+        for platform in set(crawl.seen_ids) - crawl.platforms:
+            del crawl.seen_ids[platform]
+            crawl.seen_at.pop(platform, None)
+
+    def record_activity(self, user_id: str, timestamp: float = None):
+        """
+        Mark a user as active, boosting the priority of their saved searches
+        """
+        self.user_activity[user_id] = timestamp if timestamp is not None else time.time()
+
+    def get_results(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Latest results for a crawl
+        """
+        crawl = self.crawls.get(key)
+        return crawl.results if crawl else []
+
+    def get_user_results(self, user_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Latest results for every saved search of a user
+        """
+        return {key: self.get_results(key) for key in self.user_searches.get(user_id, set())}
+
+    def _demand(self, crawl: SavedCrawl, now: float) -> float:
+        """
+        Sum of subscriber activity, each decaying with the configured half-life
+        """
+        demand = 0.0
+        for user_id in crawl.subscribers:
+            idle = max(0.0, now - self.user_activity.get(user_id, 0.0))
+            demand += 0.5 ** (idle / self.activity_half_life)
+        return demand
+
+    def _priority(self, crawl: SavedCrawl, now: float) -> float:
+        """
+        Expected number of missed postings weighted by subscriber demand
+        """
+        if crawl.last_refreshed is None:
+            return math.inf
+
+        age = now - crawl.last_refreshed
+        if age < self.min_refresh_interval:
+            return 0.0
+
+        # Platforms we have not observed yet count as one posting per hour
+        rate = sum(self.posting_rates.get(platform, 1.0) for platform in crawl.platforms)
+        expected_new = rate * age / 3600.0
+        return (1.0 + expected_new) * (1.0 + self._demand(crawl, now))
+
+    def _refill(self):
+        """
+        Token bucket refill for the global request budget
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(
+            float(self.request_budget),
+            self._tokens + elapsed * self.request_budget / self.budget_window
+        )
+
+    def _build_queue(self, now: float) -> List[Tuple[float, str]]:
+        """
+        Build a max-heap of crawls due for a refresh
+        """
+        queue = []
+        for key, crawl in self.crawls.items():
+            priority = self._priority(crawl, now)
+            if priority > 0:
+                queue.append((-priority, key))
+        heapq.heapify(queue)
+        return queue
+
+    def _update_posting_rates(self, crawl: SavedCrawl, jobs: List[Dict[str, Any]], now: float) -> Set[str]:
+        """
+        Update per-platform posting rates from the number of postings not seen before.
+
+        Boards report outages as an empty result rather than an error, so a platform
+        that returned nothing keeps its previous IDs and rate. Returns the platforms
+        that did return postings.
+        """
+        by_platform: Dict[str, Set[str]] = {}
+        for job in jobs:
+            platform = job.get('source_platform', '')
+            if job.get('external_id'):
+                by_platform.setdefault(platform, set()).add(job['external_id'])
+
+        for platform in crawl.platforms:
+            ids = by_platform.get(platform)
+            if not ids:
+                continue
+
+            seen = crawl.seen_ids.get(platform)
+            seen_at = crawl.seen_at.get(platform)
+            crawl.seen_ids[platform] = ids
+            crawl.seen_at[platform] = now
+
+            if seen is None or seen_at is None:
+                continue
+
+            hours = max((now - seen_at) / 3600.0, 1e-3)
+            observed = len(ids - seen) / hours
+            current = self.posting_rates.get(platform)
+            if current is None:
+                self.posting_rates[platform] = observed
+            else:
+                self.posting_rates[platform] = (
+                    self.rate_smoothing * observed + (1 - self.rate_smoothing) * current
+                )
+
+        return set(by_platform)
+
+    async def _refresh(self, crawl: SavedCrawl):
+        """
+        Run a single crawl on behalf of all its subscribers
+        """
+        try:
+            jobs = await self.service.search_jobs(
+                crawl.query,
+                crawl.location,
+                sorted(crawl.platforms),
+                dict(crawl.filters)
+            )
+            now = time.time()
+            refreshed = self._update_posting_rates(crawl, jobs, now)
+
+            # Keep the last known results of platforms that came back empty
+            kept = [job for job in crawl.results if job.get('source_platform') not in refreshed]
+            if kept:
+                jobs = jobs + kept
+                jobs.sort(key=lambda x: (x.get('match_score', 0), x.get('posted_date')), reverse=True)
+
+            crawl.results = jobs
+            crawl.last_refreshed = now
+            logger.info(f"Refreshed saved search '{crawl.query}' ({len(crawl.subscribers)} subscribers, {len(jobs)} jobs)")
+
+        except Exception as e:
+            # Back off as if refreshed so a failing crawl does not starve the others
+            crawl.last_refreshed = time.time()
+            logger.error(f"Error refreshing saved search '{crawl.query}': {e}")
+
+    async def run_once(self) -> int:
+        """
+        Refresh as many due crawls as the request budget allows, highest priority first
+        """
+        self._refill()
+        queue = self._build_queue(time.time())
+
+        batch = []
+        while queue:
+            _, key = heapq.heappop(queue)
+            crawl = self.crawls[key]
+            if crawl.cost > self._tokens:
+                if crawl.cost <= self.request_budget or self._tokens < self.request_budget:
+                    # Skip over crawls that do not fit rather than blocking cheaper ones
+                    continue
+                # Larger than the whole budget: run on a full bucket and go into debt,
+                # which delays later refreshes by the overage
+                logger.warning(f"Saved search '{crawl.query}' needs {crawl.cost} requests, more than the budget of {self.request_budget}")
+            self._tokens -= crawl.cost
+            batch.append(crawl)
+
+        if batch:
+            await asyncio.gather(*(self._refresh(crawl) for crawl in batch))
+
+        return len(batch)
+
+    async def run(self, interval: float = 5.0):
+        """
+        Refresh saved searches until stopped
+        """
+        self._running = True
+        while self._running:
+            await self.run_once()
+            await asyncio.sleep(interval)
+
+    def stop(self):
+        self._running = False
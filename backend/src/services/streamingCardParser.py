@@ -0,0 +1,125 @@
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingCardParser(HTMLParser):
+    """
+    Incremental HTML parser that only buffers markup inside job cards.
+
+    Cards are matched by tag name and a regex over the class attribute, the same
+    way the scrapers call ``soup.find_all``. Each card's raw markup is queued as
+    soon as its closing tag has been fed; everything outside cards is dropped.
+    A card that grows past ``max_card_chars`` (e.g. one that is never closed) is
+    discarded, so memory stays bounded whatever the page looks like.
+    """
+    def __init__(self, tag: str, class_pattern: str, max_card_chars: int = 262144):
+        super().__init__(convert_charrefs=False)
+        self.tag = tag
+        self.class_regex = re.compile(class_pattern)
+        self.max_card_chars = max_card_chars
+        self.cards: List[str] = []
+        self.discarded = 0
+        self._buffer: Optional[List[str]] = None
+        self._size = 0
+        self._depth = 0
+
+    def _matches(self, attrs) -> bool:
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes = value.split()
+                return any(self.class_regex.search(c) for c in classes) or \
+                    bool(self.class_regex.search(value))
+        return False
+
+    def _append(self, text: str):
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size > self.max_card_chars:
+            logger.warning(f"Discarding <{self.tag}> card larger than {self.max_card_chars} characters")
+            self.discarded += 1
+            self._buffer = None
+            self._size = 0
+            self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._buffer is None:
+            if tag == self.tag and self._matches(attrs):
+                self._buffer = []
+                self._size = 0
+                self._depth = 1
+                self._append(self.get_starttag_text())
+            return
+
+        if tag == self.tag:
+            self._depth += 1
+        self._append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if self._buffer is not None:
+            self._append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self._buffer is None:
+            return
+
+        if tag == self.tag:
+            self._depth -= 1
+        self._append(f"</{tag}>")
+        if self._buffer is not None and self._depth == 0:
+            self.cards.append(''.join(self._buffer))
+            self._buffer = None
+            self._size = 0
+
+    def handle_data(self, data):
+        if self._buffer is not None:
+            self._append(data)
+
+    def handle_entityref(self, name):
+        if self._buffer is not None:
+            self._append(f"&{name};")
+
+    def handle_charref(self, name):
+        if self._buffer is not None:
+            self._append(f"&#{name};")
+
+    def pop_cards(self) -> List[str]:
+        cards, self.cards = self.cards, []
+        return cards
+
+
+async def stream_cards(response,
+                       tag: str,
+                       class_pattern: str,
+                       limit: int = 20,
+                       chunk_size: int = 16384,
+                       max_card_chars: int = 262144) -> AsyncIterator[str]:
+    """
+    Yield raw card markup from an aiohttp response as the bytes arrive.
+
+    Reading stops as soon as ``limit`` cards have been yielded, so memory stays
+    bounded by one chunk plus the card currently being parsed, itself capped at
+    ``max_card_chars``.
+    """
+    decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+    parser = StreamingCardParser(tag, class_pattern, max_card_chars)
+    emitted = 0
+
+    async for chunk in response.content.iter_chunked(chunk_size):
+        parser.feed(decoder.decode(chunk))
+        for card in parser.pop_cards():
+            yield card
+            emitted += 1
+            if emitted >= limit:
+                # Drop the connection instead of draining the rest of the page
+                response.close()
+                return
+
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    for card in parser.pop_cards()[:limit - emitted]:
+        yield card
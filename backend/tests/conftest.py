@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Services are imported as top-level modules, the same way the Node bridge loads them
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src' / 'services'))
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+
+BeautifulSoup = pytest.importorskip('bs4').BeautifulSoup
+
+from cardExtractor import CardExtractor, ExtractorRegistry, DEFAULT_SPEC_PATH
+
+POST_PROCESSORS = {'date': lambda value: f"parsed:{value}"}
+
+
+def _spec(platform: str) -> dict:
+    with open(DEFAULT_SPEC_PATH) as f:
+        return json.load(f)[platform]
+
+
+def _card(markup: str):
+    return BeautifulSoup(markup, 'html.parser').find(['li', 'div'])
+
+
+def test_ranked_fallback_prefers_lower_rank_over_document_order():
+    extractor = CardExtractor('glassdoor', _spec('glassdoor'), POST_PROCESSORS)
+    card = _card(
+        '<li class="react-job-listing">'
+        '<span class="employer">Fallback Inc</span>'
+        '<a class="jobLink" href="/job/1">Data Engineer</a>'
+        '<div class="employerName">Preferred LLC</div>'
+        '<div class="listing-age">2d</div>'
+        '</li>'
+    )
+    job = extractor.extract(card)
+    assert job['company'] == {'name': 'Preferred LLC'}
+    assert job['url'] == 'https://www.glassdoor.com/job/1'
+    assert job['posted_date'] == 'parsed:2d'
+
+
+def test_rank_one_rule_is_used_when_rank_zero_is_absent():
+    extractor = CardExtractor('glassdoor', _spec('glassdoor'), POST_PROCESSORS)
+    card = _card('<li class="react-job-listing"><a class="jobLink" href="/j">Dev</a><span class="employer">Fallback Inc</span></li>')
+    assert extractor.extract(card)['company']['name'] == 'Fallback Inc'
+
+
+def test_descend_miss_does_not_fall_back():
+    # Monster cards with an <h2> but no link inside it have no title, as with card.find('h2').find('a')
+    extractor = CardExtractor('monster', _spec('monster'), POST_PROCESSORS)
+    card = _card(
+        '<div class="job-card"><h2>Promoted</h2>'
+        '<a class="title" href="/job/2">Backend Engineer</a>'
+        '<div class="company">Acme</div></div>'
+    )
+    assert extractor.extract(card) is None
+
+    card = _card('<div class="job-card"><h2><a href="/job/3">Backend Engineer</a></h2><div class="company">Acme</div></div>')
+    job = extractor.extract(card)
+    assert job['title'] == 'Backend Engineer'
+    assert job['url'] == 'https://www.monster.com/job/3'
+
+
+@pytest.mark.parametrize('markup', [
+    '<div class="job_content"><div class="company">Acme</div></div>',
+    '<div class="job_content"><a class="job_link" href="/j">Engineer</a></div>',
+    '<div class="job_content"><a class="job_link" href="/j">Engineer</a><div class="company"></div></div>',
+])
+def test_missing_required_fields_reject_the_card(markup):
+    extractor = CardExtractor('ziprecruiter', _spec('ziprecruiter'), POST_PROCESSORS)
+    assert extractor.extract(_card(markup)) is None
+
+
+def _write_spec(path, title_class: str, mtime: float):
+    spec = {
+        'board': {
+            'card': {'tag': 'div', 'class': 'card'},
+            'required': ['title'],
+            'fields': {'title': [{'tag': 'a', 'class': title_class}]}
+        }
+    }
+    path.write_text(json.dumps(spec))
+    os.utime(path, (mtime, mtime))
+
+
+def test_registry_picks_up_rewritten_spec(tmp_path):
+    path = tmp_path / 'specs.json'
+    _write_spec(path, 'old', 1000.0)
+    registry = ExtractorRegistry(str(path), check_interval=0.0)
+    card = _card('<div class="card"><a class="old">Old</a><a class="new">New</a></div>')
+    assert registry.get('board').extract(card) == {'title': 'Old'}
+
+    _write_spec(path, 'new', 2000.0)
+    assert registry.get('board').extract(card) == {'title': 'New'}
+
+
+@pytest.mark.parametrize('content', [
+    '{"board": ',
+    '{"board": {"card": {"tag": "div", "class": "card"}, "fields": {"title": [{"tag": "a", "post": "missing"}]}}}',
+])
+def test_invalid_spec_keeps_previous_extractors(tmp_path, content):
+    path = tmp_path / 'specs.json'
+    _write_spec(path, 'old', 1000.0)
+    registry = ExtractorRegistry(str(path), check_interval=0.0)
+    previous = registry.get('board')
+
+    path.write_text(content)
+    os.utime(path, (2000.0, 2000.0))
+    assert registry.get('board') is previous
+    assert registry.reload() is False
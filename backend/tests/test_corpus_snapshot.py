@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime
+
+from corpusSnapshot import CorpusSegment, CorpusSnapshotter, JobCorpus, SnapshotReplayService, write_snapshot
+
+
+def _job(external_id: str, score: float, platform: str = 'indeed') -> dict:
+    return {
+        'external_id': external_id,
+        'title': f"Engineer {external_id}",
+        'company': {'name': 'Acme', 'rating': 4.1, 'logo': None},
+        'location': 'Austin, TX',
+        'salary_display': '$100k',
+        'posted_date': datetime(2026, 10, 1, 12, 30),
+        'source_platform': platform,
+        'scraped_at': f"2026-10-01T00:00:0{int(score) % 10}",
+        'match_score': score,
+        'metadata': {'views': int(score), 'applications': 1}
+    }
+
+
+def test_round_trip_preserves_jobs_and_crawls(tmp_path):
+    corpus = JobCorpus()
+    jobs = [_job('a', 90.0), _job('b', 80.0, 'glassdoor')]
+    corpus.add_crawl('python', 'Austin', ['indeed', 'glassdoor'], {}, jobs)
+
+    path = write_snapshot(corpus, str(tmp_path))
+    loaded = JobCorpus.load(path)
+
+    crawl = loaded.latest_crawl('Python', 'austin', ['indeed'], {})
+    assert loaded.crawl_jobs(crawl) == jobs
+    assert loaded.crawl_jobs(crawl, ['glassdoor']) == [jobs[1]]
+    loaded.segment.close()
+
+
+def test_replay_returns_each_crawls_own_scores(tmp_path):
+    corpus = JobCorpus()
+    first = corpus.add_crawl('python', '', ['indeed'], {}, [_job('a', 90.0), _job('b', 10.0)])
+    second = corpus.add_crawl('golang', '', ['indeed'], {}, [_job('b', 95.0), _job('a', 5.0)])
+
+    def scores(crawl, source):
+        return [(job['external_id'], job['match_score'], job['metadata']['views']) for job in source.crawl_jobs(crawl)]
+
+    assert scores(first, corpus) == [('a', 90.0, 90), ('b', 10.0, 10)]
+    assert scores(second, corpus) == [('b', 95.0, 95), ('a', 5.0, 5)]
+
+    path = write_snapshot(corpus, str(tmp_path))
+
+    async def replay():
+        async with SnapshotReplayService(path) as service:
+            return service.replay(first['crawl_id']), await service.search_jobs('python', '', ['indeed'])
+
+    replayed, searched = asyncio.run(replay())
+    assert [job['match_score'] for job in replayed] == [90.0, 10.0]
+    assert searched == replayed
+
+
+def test_replaying_the_first_of_two_overlapping_crawls(tmp_path):
+    corpus = JobCorpus()
+    before = _job('a', 90.0)
+    after = dict(_job('a', 90.0), posted_date=datetime(2026, 10, 2, 8, 0), salary_display='$120k', location='Remote')
+    first = corpus.add_crawl('python', '', ['indeed'], {}, [before, _job('b', 50.0)])
+    second = corpus.add_crawl('python', '', ['indeed'], {}, [after, _job('b', 50.0)])
+
+    assert corpus.crawl_jobs(first) == [before, _job('b', 50.0)]
+    assert corpus.crawl_jobs(second)[0] == after
+    # 'b' came back unchanged, so both crawls share its row
+    assert len(corpus) == 3
+
+    loaded = JobCorpus.load(write_snapshot(corpus, str(tmp_path)))
+    assert loaded.crawl_jobs(loaded.crawls[0]) == [before, _job('b', 50.0)]
+    assert loaded.crawl_jobs(loaded.crawls[1])[0] == after
+    loaded.segment.close()
+
+
+def test_retention_drops_old_crawls_and_unreferenced_jobs():
+    corpus = JobCorpus(max_crawls=2)
+    corpus.add_crawl('one', '', ['indeed'], {}, [_job('a', 1.0), _job('b', 2.0)])
+    corpus.add_crawl('two', '', ['indeed'], {}, [_job('b', 3.0)])
+    corpus.add_crawl('three', '', ['indeed'], {}, [_job('c', 4.0)])
+
+    assert [crawl['query'] for crawl in corpus.crawls] == ['two', 'three']
+    assert sorted(external_id for external_id, _ in corpus.row_keys()) == ['b', 'c']
+    assert corpus.get('a') is None
+
+    aged = JobCorpus(max_age=60.0)
+    crawl = aged.add_crawl('one', '', ['indeed'], {}, [_job('a', 1.0)])
+    aged.prune(crawl['timestamp'] + 61.0)
+    assert aged.crawls == [] and len(aged) == 0
+
+
+def test_snapshot_copies_untouched_row_groups(tmp_path):
+    corpus = JobCorpus()
+    corpus.add_crawl('python', '', ['indeed'], {}, [_job('a', 90.0), _job('b', 80.0)])
+    first_path = write_snapshot(corpus, str(tmp_path / 'first'))
+
+    loaded = JobCorpus.load(first_path)
+    loaded.add_crawl('golang', '', ['indeed'], {}, [_job('c', 70.0)])
+    assert loaded.snapshot_plan()[0] == 0
+    second_path = asyncio.run(CorpusSnapshotter(loaded, str(tmp_path / 'second')).snapshot())
+
+    first, second = CorpusSegment(first_path), CorpusSegment(second_path)
+    copied = first.header['row_groups'][0]['blocks']['title']
+    assert second.raw_block(*second.header['row_groups'][0]['blocks']['title']) == first.raw_block(*copied)
+    assert second.rows == 3
+    assert second.row(2)['external_id'] == 'c'
+    first.close()
+    second.close()
+    loaded.segment.close()
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from locationGazetteer import LocationGazetteer, parse_radius
+
+
+@pytest.fixture(scope='module')
+def gazetteer():
+    return LocationGazetteer()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Seattle, WA 98101', 'us-wa-seattle'),
+    ('London, UK', 'gb-london'),
+    ('Cambridge, MA', 'us-ma-cambridge'),
+    ('Toronto, ON, Canada', 'ca-on-toronto'),
+    ('sf bay area', 'us-ca-san-francisco'),
+    ('Londn, UK', 'gb-london'),
+    ('Cambrige, MA', 'us-ma-cambridge'),
+])
+def test_resolves_qualified_names(gazetteer, text, expected):
+    assert gazetteer.location_id(text) == expected
+
+
+@pytest.mark.parametrize('text', [
+    'London, ON',
+    'Dublin, OH',
+    'Cambridge, UK',
+    'Columbia, MO',
+    'Richmond, BC',
+])
+def test_qualifier_ruling_out_every_candidate_is_unresolved(gazetteer, text):
+    # Exact, prefix and fuzzy matches all exist elsewhere; none is in the named region
+    assert gazetteer.location_id(text) is None
+
+
+def test_remote_is_unresolved(gazetteer):
+    assert gazetteer.location_id('Remote - US') is None
+
+
+def test_filter_by_radius_keeps_unresolved_and_remote(gazetteer):
+    jobs = [
+        {'location': 'Cambridge, MA'},
+        {'location': 'Seattle, WA'},
+        {'location': 'London, ON'},
+        {'location': 'Anywhere', 'remote': True},
+    ]
+    kept = gazetteer.filter_by_radius(jobs, 'Boston, MA', 25)
+    assert [job['location'] for job in kept] == ['Cambridge, MA', 'London, ON', 'Anywhere']
+
+
+@pytest.mark.parametrize('value, expected', [
+    (25, 25.0), ('25', 25.0), ('25 miles', 25.0), (' 12.5mi', 12.5),
+    ('nearby', None), ('', None), (None, None), (0, None), (float('nan'), None),
+])
+def test_parse_radius(value, expected):
+    assert parse_radius(value) == expected
+
+
+def test_two_edits_only_for_long_names(gazetteer):
+    assert gazetteer.location_id('Columbia') is None
+    assert gazetteer.location_id('Sann Fransisco') == 'us-ca-san-francisco'
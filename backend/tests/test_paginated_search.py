@@ -0,0 +1,143 @@
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from paginatedSearch import SearchPaginator, decode_cursor, encode_cursor
+
+PLATFORMS = ['indeed', 'glassdoor']
+BOARD_PAGES = 3
+CARDS = 20
+
+
+class FakeService:
+    """
+    Boards with BOARD_PAGES pages of CARDS jobs each and random match scores
+    """
+    def __init__(self, seed: int = 7, relative_dates: bool = False):
+        rng = random.Random(seed)
+        self.scores = {
+            f"{platform}-{page}-{i}": rng.choice([40, 60, 80]) if relative_dates else rng.uniform(0, 100)
+            for platform in PLATFORMS for page in range(BOARD_PAGES) for i in range(CARDS)
+        }
+        self.relative_dates = relative_dates
+        self.requests = []
+
+    async def _safe_scrape(self, platform, query, location, filters, page=0):
+        self.requests.append((platform, page))
+        if page >= BOARD_PAGES:
+            return []
+        return [
+            {'external_id': f"{platform}-{page}-{i}", 'title': f"{platform} job {page}-{i}",
+             'company': {'name': 'Acme'}, 'source_platform': platform}
+            for i in range(CARDS)
+        ]
+
+    def _remove_duplicates(self, jobs):
+        return jobs
+
+    def _filter_by_radius(self, jobs, location, filters):
+        return jobs
+
+    def _enhance_job_data(self, jobs, query, filters):
+        # Like "N days ago" or a missing date, relative dates move with the fetch time
+        posted = datetime.utcnow() if self.relative_dates else datetime(2026, 10, 1)
+        return [
+            dict(job, match_score=self.scores[job['external_id']], posted_date=posted - timedelta(hours=i % 5))
+            for i, job in enumerate(jobs)
+        ]
+
+
+def _walk(paginator, page_size=7):
+    async def walk():
+        pages, cursor = [], None
+        while True:
+            result = await paginator.page('python', '', PLATFORMS, {}, cursor, page_size)
+            pages.append((cursor, result))
+            cursor = result['next_cursor']
+            if not cursor:
+                return pages
+    return asyncio.run(walk())
+
+
+def test_every_fetched_job_is_delivered_once():
+    service = FakeService()
+    pages = _walk(SearchPaginator(service))
+
+    delivered = [job['external_id'] for _, result in pages for job in result['jobs']]
+    assert len(delivered) == len(set(delivered))
+    assert set(delivered) == set(service.scores)
+
+
+def test_older_cursors_replay_the_same_page():
+    paginator = SearchPaginator(FakeService())
+    pages = _walk(paginator)
+
+    async def replay(cursor):
+        return await paginator.page('python', '', PLATFORMS, {}, cursor, 7)
+
+    for cursor, result in pages[1:4]:
+        again = asyncio.run(replay(cursor))
+        assert [job['external_id'] for job in again['jobs']] == [job['external_id'] for job in result['jobs']]
+
+
+def test_evicted_session_is_rebuilt_in_the_same_order():
+    service = FakeService()
+    paginator = SearchPaginator(service)
+    pages = _walk(paginator)
+    cursor, result = pages[-2]
+
+    paginator.sessions.clear()
+    rebuilt = asyncio.run(paginator.page('python', '', PLATFORMS, {}, cursor, 7))
+    assert [job['external_id'] for job in rebuilt['jobs']] == [job['external_id'] for job in result['jobs']]
+
+
+def test_rebuild_with_fetch_time_dates_skips_nothing():
+    service = FakeService(relative_dates=True)
+    paginator = SearchPaginator(service)
+
+    async def walk():
+        delivered, cursor = [], None
+        while True:
+            # Evict before every page, as after a restart or on another worker
+            paginator.sessions.clear()
+            result = await paginator.page('python', '', PLATFORMS, {}, cursor, 7)
+            delivered.extend(job['external_id'] for job in result['jobs'])
+            cursor = result['next_cursor']
+            if not cursor:
+                return delivered
+
+    delivered = asyncio.run(walk())
+    assert len(delivered) == len(set(delivered))
+    assert set(delivered) == set(service.scores)
+
+
+def test_tampered_cursor_is_rejected():
+    paginator = SearchPaginator(FakeService())
+    cursor = _walk(paginator)[1][0]
+
+    state = decode_cursor(cursor, paginator.cursor_secret)
+    state['p'] = {'indeed': 50, 'glassdoor': 50}
+    payload = encode_cursor(state, b'another secret').split('.')[0]
+    forged = f"{payload}.{cursor.split('.')[1]}"
+
+    with pytest.raises(ValueError):
+        asyncio.run(paginator.page('python', '', PLATFORMS, {}, forged, 7))
+    with pytest.raises(ValueError):
+        asyncio.run(paginator.page('python', '', PLATFORMS, {}, 'not-a-cursor', 7))
+
+
+def test_rebuild_is_capped_at_max_board_pages():
+    service = FakeService()
+    paginator = SearchPaginator(service, max_board_pages=2)
+    cursor = encode_cursor({
+        'k': paginator.search_key('python', '', PLATFORMS, {}),
+        's': 'evicted',
+        'a': None,
+        'p': {'indeed': 50, 'glassdoor': 50},
+        'x': []
+    }, paginator.cursor_secret)
+
+    asyncio.run(paginator.page('python', '', PLATFORMS, {}, cursor, 7))
+    assert len(service.requests) == 2 * len(PLATFORMS)
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from searchRefreshScheduler import SearchRefreshScheduler
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+        self.responses = []
+
+    async def search_jobs(self, query, location='', platforms=None, filters=None):
+        self.calls.append((query, location, tuple(platforms), filters))
+        return self.responses.pop(0) if self.responses else []
+
+
+def _jobs(platform, ids, score=10):
+    return [{'external_id': i, 'source_platform': platform, 'match_score': score, 'posted_date': 0} for i in ids]
+
+
+def test_overlapping_searches_share_one_crawl():
+    service = FakeService()
+    scheduler = SearchRefreshScheduler(service)
+    first = scheduler.add_saved_search('u1', 'Python  Developer', 'New York', ['indeed'])
+    second = scheduler.add_saved_search('u2', 'python developer', 'new york', ['glassdoor'])
+
+    assert first == second
+    assert len(scheduler.crawls) == 1
+    assert scheduler.crawls[first].platforms == {'indeed', 'glassdoor'}
+
+    asyncio.run(scheduler.run_once())
+    assert len(service.calls) == 1
+
+
+def test_request_budget_limits_refreshes():
+    service = FakeService()
+    scheduler = SearchRefreshScheduler(service, request_budget=2, budget_window=3600)
+    for i in range(5):
+        scheduler.add_saved_search(f"u{i}", f"query {i}", '', ['indeed'])
+
+    assert asyncio.run(scheduler.run_once()) == 2
+    assert len(service.calls) == 2
+
+
+def test_active_and_stale_searches_come_first():
+    scheduler = SearchRefreshScheduler(FakeService(), min_refresh_interval=0)
+    now = time.time()
+    idle = scheduler.crawls[scheduler.add_saved_search('idle', 'a')]
+    active = scheduler.crawls[scheduler.add_saved_search('active', 'b')]
+    stale = scheduler.crawls[scheduler.add_saved_search('other', 'c')]
+    idle.last_refreshed = active.last_refreshed = now - 600
+    stale.last_refreshed = now - 6000
+    scheduler.record_activity('idle', now - 86400)
+    scheduler.record_activity('active', now)
+    scheduler.record_activity('other', now - 86400)
+
+    assert scheduler._priority(active, now) > scheduler._priority(idle, now)
+    assert scheduler._priority(stale, now) > scheduler._priority(idle, now)
+
+
+def test_empty_platform_keeps_results_and_rate():
+    service = FakeService()
+    scheduler = SearchRefreshScheduler(service, min_refresh_interval=0)
+    key = scheduler.add_saved_search('u1', 'python', '', ['indeed', 'glassdoor'])
+    crawl = scheduler.crawls[key]
+
+    service.responses.append(_jobs('indeed', ['i1', 'i2']) + _jobs('glassdoor', ['g1']))
+    asyncio.run(scheduler._refresh(crawl))
+
+    crawl.seen_at['indeed'] -= 3600
+    crawl.seen_at['glassdoor'] -= 3600
+    # Indeed is down and reports nothing; glassdoor has one new posting
+    service.responses.append(_jobs('glassdoor', ['g1', 'g2']))
+    asyncio.run(scheduler._refresh(crawl))
+
+    assert {job['external_id'] for job in crawl.results} == {'i1', 'i2', 'g1', 'g2'}
+    assert crawl.seen_ids['indeed'] == {'i1', 'i2'}
+    assert 'indeed' not in scheduler.posting_rates
+    assert round(scheduler.posting_rates['glassdoor']) == 1
+
+    # Once back, only genuinely new indeed postings count towards its rate
+    crawl.seen_at['indeed'] -= 3600
+    service.responses.append(_jobs('indeed', ['i1', 'i2', 'i3']) + _jobs('glassdoor', ['g1', 'g2']))
+    asyncio.run(scheduler._refresh(crawl))
+    assert scheduler.posting_rates['indeed'] < 1.0
+
+
+def test_crawl_larger_than_budget_runs_on_full_bucket():
+    service = FakeService()
+    scheduler = SearchRefreshScheduler(service, request_budget=2, budget_window=3600)
+    scheduler.add_saved_search('u1', 'python')
+
+    assert asyncio.run(scheduler.run_once()) == 1
+    # The overage is owed before anything else runs
+    scheduler.add_saved_search('u2', 'golang', '', ['indeed'])
+    assert asyncio.run(scheduler.run_once()) == 0
+    assert len(service.calls) == 1
+
+
+def test_removing_a_subscriber_drops_their_platforms():
+    service = FakeService()
+    scheduler = SearchRefreshScheduler(service)
+    key = scheduler.add_saved_search('u1', 'python', '', ['indeed'])
+    scheduler.add_saved_search('u2', 'python', '', ['indeed', 'glassdoor', 'monster'])
+    crawl = scheduler.crawls[key]
+    service.responses = [_jobs('indeed', ['a']) + _jobs('glassdoor', ['b']) + _jobs('monster', ['c'])]
+    asyncio.run(scheduler.run_once())
+
+    scheduler.remove_saved_search('u2', key)
+    assert crawl.platforms == {'indeed'}
+    assert crawl.cost == 1
+    assert [job['external_id'] for job in crawl.results] == ['a']
+    assert set(crawl.seen_ids) == {'indeed'}
@@ -0,0 +1,75 @@
+import asyncio
+
+from streamingCardParser import StreamingCardParser, stream_cards
+
+CARD = '<div class="tapItem job_seen_beacon"><h2 class="jobTitle"><a href="/a?x=1&amp;y=2">Dev &amp; Ops</a></h2><div>n<br>ested</div></div>'
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.read = 0
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self.body), size):
+            self.read = start + size
+            yield self.body[start:start + size]
+
+
+class FakeResponse:
+    charset = 'utf-8'
+
+    def __init__(self, body: bytes):
+        self.content = FakeContent(body)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _page(cards: int) -> str:
+    return '<html><body><div class="results">' + CARD * cards + '</div></body></html>'
+
+
+def _collect(response, **kwargs):
+    async def run():
+        return [card async for card in stream_cards(response, 'div', r'job_seen_beacon', **kwargs)]
+    return asyncio.run(run())
+
+
+def test_cards_are_emitted_verbatim_across_chunk_boundaries():
+    parser = StreamingCardParser('div', r'job_seen_beacon')
+    html = _page(2)
+    for start in range(0, len(html), 7):
+        parser.feed(html[start:start + 7])
+
+    assert parser.pop_cards() == [CARD, CARD]
+
+
+def test_stops_reading_after_limit():
+    body = _page(100).encode()
+    response = FakeResponse(body)
+
+    cards = _collect(response, limit=3, chunk_size=256)
+
+    assert len(cards) == 3
+    assert response.closed
+    assert response.content.read < len(body) // 10
+
+
+def test_unclosed_card_is_discarded_and_buffer_stays_bounded():
+    parser = StreamingCardParser('div', r'job_seen_beacon', max_card_chars=1000)
+    parser.feed('<div class="job_seen_beacon"><div>never closed')
+    for _ in range(100):
+        parser.feed('<p>' + 'x' * 100 + '</p>')
+        assert parser._size <= 1000
+
+    assert parser.discarded == 1
+    parser.feed(CARD)
+    assert parser.pop_cards() == [CARD]
+
+
+def test_multibyte_characters_split_between_chunks():
+    card = '<div class="job_seen_beacon">Zürich – Café</div>'
+    cards = _collect(FakeResponse(card.encode()), chunk_size=1)
+    assert cards == [card]
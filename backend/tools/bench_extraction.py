@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Per-card extraction benchmark
+
+Compares the hand-written _parse_*_job methods against the compiled
+declarative extractors on synthetic cards for every platform.
+
+    python tools/bench_extraction.py --cards 200 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the services directory to Python path
+services_dir = Path(__file__).resolve().parent.parent / 'src' / 'services'
+sys.path.insert(0, str(services_dir))
+
+from bs4 import BeautifulSoup
+
+from jobSearchService import JobSearchService
+from sample_pages import PLATFORMS, render_results_page
+
+
+def _comparable(job):
+    # posted_date is relative to utcnow, so compare everything else
+    return {k: v for k, v in (job or {}).items() if k != 'posted_date'}
+
+
+def _time_per_card(parse, cards, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for card in cards:
+            parse(card)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cards) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cards', type=int, default=200, help='cards per platform')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions (best is kept)')
+    args = parser.parse_args()
+
+    service = JobSearchService()
+    legacy = {
+        'indeed': service._parse_indeed_job,
+        'glassdoor': service._parse_glassdoor_job,
+        'ziprecruiter': service._parse_ziprecruiter_job,
+        'monster': service._parse_monster_job,
+        'careerbuilder': service._parse_careerbuilder_job
+    }
+
+    print(f"{'platform':<14}{'legacy us/card':>16}{'spec us/card':>14}{'speedup':>10}{'mismatches':>12}")
+    for platform in PLATFORMS:
+        extractor = service.extractors.get(platform)
+        soup = BeautifulSoup(render_results_page(platform, args.cards, padding_kb=0), 'html.parser')
+        cards = soup.find_all(extractor.card_tag, {'class': re.compile(extractor.card_class)})
+
+        def compiled(card, platform=platform):
+            return service._parse_card(platform, card, legacy[platform])
+
+        mismatches = sum(
+            1 for card in cards
+            if _comparable(legacy[platform](card)) != _comparable(compiled(card))
+        )
+
+        legacy_us = _time_per_card(legacy[platform], cards, args.repeat)
+        spec_us = _time_per_card(compiled, cards, args.repeat)
+        print(f"{platform:<14}{legacy_us:>16.1f}{spec_us:>14.1f}{legacy_us / spec_us:>9.2f}x{mismatches:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test for JobSearchService
+
+Runs concurrent search_jobs calls from a single service process against the
+mock job boards and reports throughput, latency percentiles, CPU and RSS.
+Passing several --concurrency values sweeps them to find the saturation point.
+
+    python tools/loadgen.py --concurrency 1 4 16 64 --searches 200 --streaming
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any
+
+import aiohttp
+
+tools_dir = Path(__file__).resolve().parent
+# Add the services directory to Python path
+sys.path.insert(0, str(tools_dir.parent / 'src' / 'services'))
+
+from jobSearchService import JobSearchService
+from mock_job_boards import mock_base_urls
+from sample_pages import PLATFORMS
+
+QUERIES = [
+    ('python developer', 'New York'), ('data scientist', 'San Francisco'),
+    ('frontend engineer', 'Austin'), ('devops', 'Seattle'), ('java developer', 'Chicago'),
+    ('machine learning', 'Remote'), ('site reliability', 'Boston'), ('full stack', 'Denver')
+]
+
+
+def _rss_mb() -> float:
+    """
+    Current resident set size, falling back to the peak where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def mock_stats(port: int) -> Dict[str, int]:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"http://127.0.0.1:{port}/_stats") as response:
+            return await response.json()
+
+
+async def run_level(service: JobSearchService, platforms: List[str], concurrency: int, searches: int, port: int) -> Dict[str, Any]:
+    """
+    Run `searches` searches with `concurrency` in flight and collect metrics.
+
+    search_jobs swallows board failures, so failed fetches are read from the mock's
+    counters and a search counts as degraded when any board contributed no jobs.
+    """
+    latencies: List[float] = []
+    job_counts: List[int] = []
+    errors = 0
+    degraded = 0
+    remaining = iter(range(searches))
+
+    async def worker():
+        nonlocal errors, degraded
+        for i in remaining:
+            query, location = QUERIES[i % len(QUERIES)]
+            start = time.perf_counter()
+            try:
+                jobs = await service.search_jobs(f"{query} {i}", location, platforms)
+                job_counts.append(len(jobs))
+                if {job.get('source_platform') for job in jobs} != set(platforms):
+                    degraded += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    stats_before = await mock_stats(port)
+    rss_before = _rss_mb()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    stats_after = await mock_stats(port)
+    board_requests = stats_after['requests'] - stats_before['requests']
+    board_errors = (stats_after['429'] - stats_before['429']) + (stats_after['5xx'] - stats_before['5xx'])
+
+    return {
+        'concurrency': concurrency,
+        'searches': searches,
+        'errors': errors,
+        'degraded': degraded,
+        'board_requests': board_requests,
+        'board_errors': board_errors,
+        'searches_per_sec': searches / wall if wall else 0.0,
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p95_ms': _percentile(latencies, 95) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'cpu_pct': cpu / wall * 100 if wall else 0.0,
+        'rss_mb': _rss_mb(),
+        'rss_delta_mb': _rss_mb() - rss_before,
+        'avg_jobs': sum(job_counts) / len(job_counts) if job_counts else 0.0
+    }
+
+
+async def wait_for_server(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(f"http://127.0.0.1:{port}/_stats") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Mock job boards did not start on port {port}")
+            await asyncio.sleep(0.1)
+
+
+async def run(args) -> List[Dict[str, Any]]:
+    await wait_for_server(args.port)
+
+    results = []
+    service = JobSearchService(
+        streaming=args.streaming,
+        base_urls=mock_base_urls(args.port),
+        request_delay=(0.0, 0.0),
+        connection_limit=args.connection_limit,
+        connection_limit_per_host=args.connection_limit_per_host
+    )
+    async with service:
+        # Warm up imports, extractor compilation and connection pool
+        await run_level(service, args.platforms, 1, len(args.platforms), args.port)
+        for concurrency in args.concurrency:
+            result = await run_level(service, args.platforms, concurrency, args.searches, args.port)
+            results.append(result)
+            if not args.json:
+                print(
+                    f"{result['concurrency']:>11}{result['searches_per_sec']:>12.1f}"
+                    f"{result['p50_ms']:>10.0f}{result['p95_ms']:>10.0f}{result['p99_ms']:>10.0f}"
+                    f"{result['cpu_pct']:>8.0f}{result['rss_mb']:>9.1f}{result['avg_jobs']:>10.1f}"
+                    f"{result['degraded']:>10}{result['board_errors']:>8}/{result['board_requests']:<6}{result['errors']:>8}",
+                    flush=True
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--searches', type=int, default=100, help='searches per concurrency level')
+    parser.add_argument('--platforms', nargs='+', default=PLATFORMS, choices=PLATFORMS)
+    parser.add_argument('--streaming', action='store_true', help='use streaming card extraction')
+    parser.add_argument('--connection-limit', type=int, default=10)
+    parser.add_argument('--connection-limit-per-host', type=int, default=5)
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--no-server', action='store_true', help='use an already running mock server')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args, server_args = parser.parse_known_args()
+
+    # Keep per-scrape info logs out of the measurements
+    logging.basicConfig(level=logging.WARNING)
+
+    server = None
+    if not args.no_server:
+        # Separate process so the mock's CPU is not counted against the service
+        server = subprocess.Popen(
+            [sys.executable, str(tools_dir / 'mock_job_boards.py'), '--port', str(args.port)] + server_args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    try:
+        if not args.json:
+            print(f"{'concurrency':>11}{'searches/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'cpu %':>8}{'rss MB':>9}{'avg jobs':>10}{'degraded':>10}{'board fails':>15}{'errors':>8}")
+        results = asyncio.run(run(args))
+        if args.json:
+            print(json.dumps(results, indent=2))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Local mock job board server
+
+Serves synthetic result pages for every platform JobSearchService scrapes,
+with configurable latency, page size, error injection and slow-drip bodies.
+Point the service at it with base_urls=mock_base_urls(port).
+
+    python tools/mock_job_boards.py --port 8090 --latency lognormal --latency-ms 150
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import random
+from typing import Dict, Tuple
+
+from aiohttp import web
+
+from sample_pages import PLATFORMS, render_results_page
+
+logger = logging.getLogger(__name__)
+
+# Search path of each board, mounted under /<platform>
+ROUTES = {
+    'indeed': '/jobs',
+    'glassdoor': '/Job/jobs.htm',
+    'ziprecruiter': '/jobs-search',
+    'monster': '/jobs/search',
+    'careerbuilder': '/jobs'
+}
+
+
+def mock_base_urls(port: int, host: str = '127.0.0.1') -> Dict[str, str]:
+    """
+    base_urls for JobSearchService that target the mock server
+    """
+    return {platform: f"http://{host}:{port}/{platform}" for platform in PLATFORMS}
+
+
+class MockJobBoards:
+    """
+    aiohttp application emulating the job boards' search result pages
+    """
+    def __init__(self,
+                 latency: str = 'fixed',
+                 latency_ms: float = 100.0,
+                 latency_jitter_ms: float = 50.0,
+                 cards: int = 25,
+                 padding_kb: int = 64,
+                 variants: int = 50,
+                 error_429_rate: float = 0.0,
+                 error_5xx_rate: float = 0.0,
+                 slow_drip_rate: float = 0.0,
+                 drip_chunk_bytes: int = 2048,
+                 drip_delay_ms: float = 20.0,
+                 seed: int = None):
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.cards = cards
+        self.padding_kb = padding_kb
+        self.variants = variants
+        self.error_429_rate = error_429_rate
+        self.error_5xx_rate = error_5xx_rate
+        self.slow_drip_rate = slow_drip_rate
+        self.drip_chunk_bytes = drip_chunk_bytes
+        self.drip_delay_ms = drip_delay_ms
+        self.rng = random.Random(seed)
+        self.stats = {'requests': 0, '429': 0, '5xx': 0, 'slow_drip': 0}
+        # Rendered pages, at most one per platform and variant
+        self._pages: Dict[Tuple[str, int], bytes] = {}
+
+    def _latency(self) -> float:
+        """
+        Sample a response delay in seconds from the configured distribution
+        """
+        mean = self.latency_ms
+        if self.latency == 'uniform':
+            delay = self.rng.uniform(mean - self.latency_jitter_ms, mean + self.latency_jitter_ms)
+        elif self.latency == 'exponential':
+            delay = self.rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+        elif self.latency == 'lognormal':
+            # Heavy right tail with the configured median and spread
+            sigma = self.latency_jitter_ms / mean if mean > 0 else 0.0
+            delay = mean * self.rng.lognormvariate(0.0, sigma)
+        else:
+            delay = mean
+        return max(delay, 0.0) / 1000.0
+
+    def _page(self, platform: str, variant: int) -> bytes:
+        page = self._pages.get((platform, variant))
+        if page is None:
+            page = render_results_page(platform, self.cards, variant, self.padding_kb).encode('utf-8')
+            self._pages[(platform, variant)] = page
+        return page
+
+    def _variant(self, request: web.Request) -> int:
+        # The same query always gets the same page so repeated searches are comparable
+        digest = hashlib.md5(request.query_string.encode()).hexdigest()
+        return int(digest, 16) % self.variants
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        platform = request.match_info['platform']
+        self.stats['requests'] += 1
+        await asyncio.sleep(self._latency())
+
+        roll = self.rng.random()
+        if roll < self.error_429_rate:
+            self.stats['429'] += 1
+            return web.Response(status=429, headers={'Retry-After': '1'}, text='Too Many Requests')
+        if roll < self.error_429_rate + self.error_5xx_rate:
+            self.stats['5xx'] += 1
+            return web.Response(status=self.rng.choice([500, 502, 503]), text='Server Error')
+
+        body = self._page(platform, self._variant(request))
+        if self.rng.random() >= self.slow_drip_rate:
+            return web.Response(body=body, content_type='text/html', charset='utf-8')
+
+        self.stats['slow_drip'] += 1
+        response = web.StreamResponse(headers={'Content-Type': 'text/html; charset=utf-8'})
+        await response.prepare(request)
+        for start in range(0, len(body), self.drip_chunk_bytes):
+            await response.write(body[start:start + self.drip_chunk_bytes])
+            await asyncio.sleep(self.drip_delay_ms / 1000.0)
+        await response.write_eof()
+        return response
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        for platform, path in ROUTES.items():
+            app.router.add_get(f"/{{platform:{platform}}}{path}", self.handle)
+        app.router.add_get('/_stats', self.handle_stats)
+        return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency', choices=['fixed', 'uniform', 'exponential', 'lognormal'], default='fixed')
+    parser.add_argument('--latency-ms', type=float, default=100.0, help='mean (median for lognormal) delay')
+    parser.add_argument('--latency-jitter-ms', type=float, default=50.0, help='spread for uniform/lognormal')
+    parser.add_argument('--cards', type=int, default=25, help='job cards per page')
+    parser.add_argument('--padding-kb', type=int, default=64, help='page chrome around the cards')
+    parser.add_argument('--variants', type=int, default=50, help='distinct result pages per platform')
+    parser.add_argument('--error-429', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--error-5xx', type=float, default=0.0, help='fraction of requests answered with 5xx')
+    parser.add_argument('--slow-drip', type=float, default=0.0, help='fraction of responses trickled out')
+    parser.add_argument('--drip-chunk-bytes', type=int, default=2048)
+    parser.add_argument('--drip-delay-ms', type=float, default=20.0)
+    parser.add_argument('--seed', type=int, default=None)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    boards = MockJobBoards(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        cards=args.cards,
+        padding_kb=args.padding_kb,
+        variants=args.variants,
+        error_429_rate=args.error_429,
+        error_5xx_rate=args.error_5xx,
+        slow_drip_rate=args.slow_drip,
+        drip_chunk_bytes=args.drip_chunk_bytes,
+        drip_delay_ms=args.drip_delay_ms,
+        seed=args.seed
+    )
+    web.run_app(boards.app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Synthetic job board result pages.
+
+Markup mirrors the selectors the scrapers look for on each platform, wrapped in
+enough page chrome to resemble a real search results page.
+"""
+
+import random
+from html import escape
+from typing import List
+
+PLATFORMS = ['indeed', 'glassdoor', 'ziprecruiter', 'monster', 'careerbuilder']
+
+TITLES = [
+    'Software Engineer', 'Senior Python Developer', 'Frontend Engineer (React)',
+    'Data Scientist', 'DevOps Engineer', 'Junior Java Developer', 'Staff Backend Engineer',
+    'Machine Learning Engineer', 'Full Stack Developer', 'Site Reliability Engineer',
+    'Contract Node.js Developer', 'Software Engineering Intern'
+]
+COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries',
+    'Wayne Enterprises', 'Soylent Systems', 'Vandelay Industries', 'Tyrell Corp'
+]
+LOCATIONS = [
+    'New York, NY', 'San Francisco, CA', 'Austin, TX', 'Seattle, WA', 'Chicago, IL',
+    'Boston, MA', 'Denver, CO', 'Remote', 'Atlanta, GA', 'Los Angeles, CA'
+]
+SNIPPETS = [
+    'Build and maintain scalable services in Python and Go on AWS.',
+    'Work with React, TypeScript and GraphQL on our customer dashboard.',
+    'Own CI/CD pipelines with Docker, Kubernetes and Terraform.',
+    'Train and deploy models with PyTorch, pandas and Spark.',
+    'Design REST APIs backed by PostgreSQL and Redis in an agile team.'
+]
+AGES = ['Just posted', 'Today', '1 day ago', '3 days ago', '1 week ago', '2 weeks ago', '30+ days ago']
+
+
+def _salary(rng: random.Random) -> str:
+    if rng.random() < 0.2:
+        return f"${rng.randint(30, 90)} an hour"
+    low = rng.randint(60, 160)
+    return f"${low}K - ${low + rng.randint(10, 60)}K a year"
+
+
+def render_card(platform: str, rng: random.Random, index: int) -> str:
+    """
+    Render one job card for a platform
+    """
+    title = escape(rng.choice(TITLES))
+    company = escape(rng.choice(COMPANIES))
+    location = escape(rng.choice(LOCATIONS))
+    snippet = escape(rng.choice(SNIPPETS))
+    salary = escape(_salary(rng))
+    age = escape(rng.choice(AGES))
+    job_key = f"{rng.getrandbits(48):012x}"
+
+    if platform == 'indeed':
+        return (
+            f'<div class="cardOutline tapItem job_seen_beacon" data-jk="{job_key}">'
+            f'<table class="jobCard_mainContent"><tbody><tr><td>'
+            f'<h2 class="jobTitle css-1h4a4n5"><a href="/rc/clk?jk={job_key}&amp;from=serp" data-jk="{job_key}">'
+            f'<span title="{title}">{title}</span></a></h2>'
+            f'<span class="companyName">{company}</span>'
+            f'<div class="companyLocation">{location}</div>'
+            f'<span class="salaryText">{salary}</span>'
+            f'</td></tr></tbody></table>'
+            f'<div class="job-snippet summary"><ul><li>{snippet}</li></ul></div>'
+            f'<span class="date"><span class="visually-hidden">Posted</span>{age}</span>'
+            f'</div>'
+        )
+    if platform == 'glassdoor':
+        return (
+            f'<li class="JobsList_jobListItem__wjTHv" data-jobid="{job_key}" data-index="{index}">'
+            f'<div class="JobCard_jobCardContainer"><div class="JobCard_employerRow">'
+            f'<div class="EmployerProfile_employerName">{company}</div>'
+            f'<span class="EmployerProfile_rating">{rng.randint(28, 49) / 10}</span></div>'
+            f'<a class="JobCard_jobTitle jobLink" href="/job-listing/{job_key}.htm">{title}</a>'
+            f'<div class="JobCard_location">{location}</div>'
+            f'<div class="JobCard_salaryEstimate">{salary}</div>'
+            f'<div class="JobCard_listing-age">{age}</div>'
+            f'</div></li>'
+        )
+    if platform == 'ziprecruiter':
+        return (
+            f'<div class="job_content" data-job-id="{job_key}">'
+            f'<h2 class="job_heading"><a class="job_link" href="/c/{company.replace(" ", "-")}/Job/{job_key}">{title}</a></h2>'
+            f'<a class="company_name t_org_link" href="/co/{job_key}">{company}</a>'
+            f'<div class="location">{location}</div>'
+            f'<div class="salary">{salary}</div>'
+            f'<div class="job_snippet">{snippet}</div>'
+            f'</div>'
+        )
+    if platform == 'monster':
+        return (
+            f'<div class="job-search-resultsstyle__JobCardWrap job-card" data-id="{job_key}">'
+            f'<h2 class="card-title"><a href="/job-openings/{job_key}">{title}</a></h2>'
+            f'<div class="card-company">{company}</div>'
+            f'<div class="card-location">{location}</div>'
+            f'<p class="card-description">{snippet}</p>'
+            f'</div>'
+        )
+    if platform == 'careerbuilder':
+        return (
+            f'<div class="data-results-content block job-listing-item" data-job-did="{job_key}">'
+            f'<h2 class="data-results-title"><a href="https://www.careerbuilder.com/job/{job_key}">{title}</a></h2>'
+            f'<div class="data-details"><div class="company-name">{company}</div>'
+            f'<div class="job-location">{location}</div></div>'
+            f'<div class="block show-mobile">{snippet}</div>'
+            f'</div>'
+        )
+    raise ValueError(f"Unknown platform: {platform}")
+
+
+def render_cards(platform: str, count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(f"{platform}:{seed}")
+    return [render_card(platform, rng, i) for i in range(count)]
+
+
+def render_results_page(platform: str, count: int = 25, seed: int = 0, padding_kb: int = 64) -> str:
+    """
+    Render a full results page with `count` cards and roughly `padding_kb` of page chrome
+    """
+    cards = render_cards(platform, count, seed)
+    # Inline scripts and navigation dominate the size of real result pages
+    state = ','.join(f'"k{i}":"{"x" * 1000}"' for i in range(padding_kb))
+    script = f'<script>window.__INITIAL_STATE__={{{state}}};</script>'
+    nav = ''.join(f'<li><a href="/browse/{i}">Category {i}</a></li>' for i in range(60))
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        f'<title>Jobs on {platform}</title>{script}</head><body>'
+        f'<header><nav><ul>{nav}</ul></nav></header>'
+        f'<main><div id="results"><ul class="results-list">{"".join(cards)}</ul></div></main>'
+        '<footer><p>&copy; Job board</p></footer>'
+        '</body></html>'
+    )